@@ -406,6 +406,7 @@ class ZIPPED_URLS(object):  # NOQA
     )
     ASSIGNER = f'{WILDBOOK_IA_MODELS_BASE}/databases/testdb_assigner.zip'
     K7_EXAMPLE = f'{WILDBOOK_IA_MODELS_BASE}/databases/testdb_kaggle7.zip'
+    TESTDATA = f'{WILDBOOK_IA_MODELS_BASE}/data/testdata.zip'
 
 
 # Turn off features at Lewa :(
@@ -931,6 +931,13 @@ class IBEISController(BASE_CLASS):
         self.qresdir = join(self.dbdir, REL_PATHS.qres)
         self.bigcachedir = join(self.dbdir, REL_PATHS.bigcache)
         self.distinctdir = join(self.dbdir, REL_PATHS.distinctdir)
+        # Job engine shelves, one directory per engine slot
+        engine_slot = str(const.ENGINE_SLOT).lower()
+        if engine_slot in ['none', 'null', '1', 'default']:
+            engine_shelve_dir = 'engine_shelves'
+        else:
+            engine_shelve_dir = 'engine_shelves_{}'.format(engine_slot)
+        self.shelvesdir = join(self.cachedir, engine_shelve_dir)
         if ensure:
             self.ensure_directories()
         assert dbdir is not None, 'must specify database directory'
@@ -1009,13 +1016,7 @@ class IBEISController(BASE_CLASS):
         return self.dbcache.uri
 
     def get_shelves_path(self):
-        engine_slot = const.ENGINE_SLOT
-        engine_slot = str(engine_slot).lower()
-        if engine_slot in ['none', 'null', '1', 'default']:
-            engine_shelve_dir = 'engine_shelves'
-        else:
-            engine_shelve_dir = 'engine_shelves_{}'.format(engine_slot)
-        return join(self.get_cachedir(), engine_shelve_dir)
+        return self.shelvesdir
 
     def get_trashdir(self):
         return self.trashdir
@@ -7,6 +7,7 @@ but without the need for an actual IBEIS Controller
 import logging
 import os
 from functools import lru_cache
+from itertools import combinations
 from os.path import exists, join, realpath
 from pathlib import Path
 
@@ -26,7 +27,7 @@ __APPNAME__ = 'wbia'
 
 ALLOW_GUI = ut.WIN32 or os.environ.get('DISPLAY', None) is not None
 
-WILDBOOK_IA_MODELS_BASE = os.getenv('WILDBOOK_IA_MODELS_BASE', 'https://wildbookiarepository.azureedge.net')
+WILDBOOK_IA_MODELS_BASE = const.WILDBOOK_IA_MODELS_BASE
 
 
 def get_wbia_resource_dir():
@@ -237,7 +238,7 @@ def delete_dbdir(dbname):
     ut.delete(join(get_workdir(), dbname), ignore_errors=False)
 
 
-def db_to_dbdir(db, allow_newdir=False, extra_workdirs=[]):
+def db_to_dbdir(db, allow_newdir=False, extra_workdirs=()):
     """
     Implicitly gets dbdir. Searches for db inside of workdir
     """
@@ -252,11 +253,9 @@ def db_to_dbdir(db, allow_newdir=False, extra_workdirs=[]):
     work_dir = get_workdir()
     dbalias_dict = get_dbalias_dict()
 
-    workdir_list = []
-    for extra_dir in extra_workdirs:
-        if exists(extra_dir):
-            workdir_list.append(extra_dir)
-    workdir_list.append(work_dir)  # TODO: Allow multiple workdirs?
+    # Normalize the caller-supplied extra workdirs once into a hashable tuple
+    valid_extras = tuple(extra_dir for extra_dir in extra_workdirs if exists(extra_dir))
+    workdir_list = valid_extras + (work_dir,)  # TODO: Allow multiple workdirs?
 
     # Check all of your work directories for the database
     for _dir in workdir_list:
@@ -513,9 +512,14 @@ def ensure_pz_mtest():
     other_gids = ut.setdiff(ibs.get_valid_gids(), occurrence_gids)
     other_gids1 = other_gids[0::2]
     other_gids2 = other_gids[1::2]
-    ibs.set_image_imagesettext(occurrence_gids, ['Occurrence 1'] * len(occurrence_gids))
-    ibs.set_image_imagesettext(other_gids1, ['Occurrence 2'] * len(other_gids1))
-    ibs.set_image_imagesettext(other_gids2, ['Occurrence 3'] * len(other_gids2))
+    occurrence_text_list = (
+        ['Occurrence 1'] * len(occurrence_gids)
+        + ['Occurrence 2'] * len(other_gids1)
+        + ['Occurrence 3'] * len(other_gids2)
+    )
+    ibs.set_image_imagesettext(
+        occurrence_gids + other_gids1 + other_gids2, occurrence_text_list
+    )
 
     # hack in some tags
     logger.info('Hacking in some tags')
@@ -577,8 +581,6 @@ def reset_mtest_graph():
         staging.clear()
 
     # Make this CC connected using positive edges
-    import itertools as it
-
     from wbia.algo.graph import nx_utils as nxu
     from wbia.algo.graph.state import DIFF, INCMP, NEGTV, NULL, POSTV, SAME  # NOQA
 
@@ -597,7 +599,7 @@ def reset_mtest_graph():
 
     # Make all small PCCs k-negative-redundant
     count = 0
-    for cc1, cc2 in it.combinations(small_ccs, 2):
+    for cc1, cc2 in combinations(small_ccs, 2):
         count += 1
         for edge in infr.find_neg_augment_edges(cc1, cc2, k=1):
             if count > 10:
@@ -729,7 +731,7 @@ def ensure_pz_mtest_batchworkflow_test():
             imageset_aids_list[imageset_idx].extend(aids)
             imageset_idx = (imageset_idx + 1) % len(imageset_aids_list)
         else:
-            for chunk in list(ut.ichunks(aids, 2)):
+            for chunk in ut.ichunks(aids, 2):
                 imageset_aids_list[imageset_idx].extend(chunk)
                 imageset_idx = (imageset_idx + 1) % len(imageset_aids_list)
 
@@ -840,17 +842,24 @@ def ensure_pz_mtest_mergesplit_test():
     # the first 3 become merge cases
     # left = 0
     # right = left + num_merge
+    # Accumulate the name assignments and write each phase in a single call
+    merge_aids, merge_nids1_, merge_nids2_ = [], [], []
     for aids, nid1, nid2 in zip(modify_aids[0:3], merge_nids1, merge_nids2):
         # ibs.get_annot_nids(aids)
         aids_ = aids[::2]
-        ibs.set_annot_name_rowids(aids_, [nid1] * len(aids_))
-        ibs.set_annot_name_rowids(aids_, [nid2] * len(aids_))
+        merge_aids.extend(aids_)
+        merge_nids1_.extend([nid1] * len(aids_))
+        merge_nids2_.extend([nid2] * len(aids_))
+    ibs.set_annot_name_rowids(merge_aids, merge_nids1_)
+    ibs.set_annot_name_rowids(merge_aids, merge_nids2_)
 
     # the next 2 become split cases
     # left = right
     # right = left + num_split_names
+    all_aids, all_nids = [], []
     for aids in modify_aids[3:5]:
-        ibs.set_annot_name_rowids(aids, [split_nid] * len(aids))
+        all_aids.extend(aids)
+        all_nids.extend([split_nid] * len(aids))
 
     # left = right
     # right = left + num_combo_names
@@ -858,8 +867,11 @@ def ensure_pz_mtest_mergesplit_test():
     for aids in modify_aids[5:8]:
         aids_even = aids[::2]
         aids_odd = aids[1::2]
-        ibs.set_annot_name_rowids(aids_even, [combo_nids[0]] * len(aids_even))
-        ibs.set_annot_name_rowids(aids_odd, [combo_nids[1]] * len(aids_odd))
+        all_aids.extend(aids_even)
+        all_nids.extend([combo_nids[0]] * len(aids_even))
+        all_aids.extend(aids_odd)
+        all_nids.extend([combo_nids[1]] * len(aids_odd))
+    ibs.set_annot_name_rowids(all_aids, all_nids)
 
     final_result = ibs.unflat_map(ibs.get_annot_nids, modify_aids)
     logger.info('final_result = {}'.format(ub.repr2(final_result)))
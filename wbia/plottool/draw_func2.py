@@ -3740,7 +3740,8 @@ def imshow(
                 #    #del plt_imshow_kwargs['vmin']
                 #    #del plt_imshow_kwargs['vmax']
             if img.shape[2] == 3:
-                imgRGB = cv2.cvtColor(imgBGR, cv2.COLOR_BGR2RGB)
+                # Reversed-channel view; avoids the copy cvtColor would make
+                imgRGB = imgBGR[..., ::-1]
                 # logger.info('plt_imshow_kwargs = %r' % (plt_imshow_kwargs,))
                 ax.imshow(imgRGB, **plt_imshow_kwargs)
             else:
@@ -43,7 +43,7 @@ class MultiImageInteraction(BASE_CLASS):
         >>> test_image_dir = ut.grab_zipped_url(TEST_IMAGES_URL, appname='utool')
         >>> # test image paths
         >>> imgpaths       = ut.list_images(test_image_dir, fullpath=True, recursive=False)
-        >>> bboxes_list = [[]] * len(imgpaths)
+        >>> bboxes_list = [None] * len(imgpaths)
         >>> #bboxes_list[0] = [(-200, -100, 400, 400)]
         >>> bboxes_list[0] = [(20, 10, 400, 400)]
         >>> iteract_obj = MultiImageInteraction(imgpaths, nPerPage=4,
@@ -76,9 +76,10 @@ class MultiImageInteraction(BASE_CLASS):
         if nImgs is None:
             nImgs = len(gpath_list)
         if bboxes_list is None:
-            bboxes_list = [[]] * nImgs
+            # None entries mean the image has no bboxes
+            bboxes_list = [None] * nImgs
         if thetas_list is None:
-            thetas_list = [[0] * len(bboxes) for bboxes in bboxes_list]
+            thetas_list = [[0] * len(bboxes or []) for bboxes in bboxes_list]
         # How many images we are showing and per page
         self.thetas_list = thetas_list
         self.bboxes_list = bboxes_list
@@ -202,7 +203,7 @@ class MultiImageInteraction(BASE_CLASS):
             else:
                 img = gpath
 
-            bbox_list = self.bboxes_list[index]
+            bbox_list = self.bboxes_list[index] or []
             # print('bbox_list %r in display for px: %r ' % (bbox_list, px))
             theta_list = self.thetas_list[index]
 
@@ -285,7 +286,7 @@ class MultiImageInteraction(BASE_CLASS):
                     gpath(fnum=fnum)
                     df2.update()
                 else:
-                    bbox_list = self.bboxes_list[index]
+                    bbox_list = self.bboxes_list[index] or []
                     print('Bbox of figure: {!r}'.format(bbox_list))
                     theta_list = self.thetas_list[index]
                     print('theta_list = {!r}'.format(theta_list))
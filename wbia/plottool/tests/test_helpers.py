@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
+from functools import lru_cache
 
 
 def dummy_bbox(img, shiftxy=(0.0, 0.0), scale=0.25):
     """Default to rectangle that has a quarter-width/height border."""
-    (gh, gw) = img.shape[0:2]
+    return _dummy_bbox(img.shape[0:2], tuple(shiftxy), scale)
+
+
+@lru_cache(maxsize=64)
+def _dummy_bbox(shape, shiftxy, scale):
+    (gh, gw) = shape
     half_w = gw / 2
     half_h = gh / 2
     w = gw * scale
@@ -15,7 +21,13 @@ def dummy_bbox(img, shiftxy=(0.0, 0.0), scale=0.25):
 
 
 def imread_many(imgpaths):
+    import concurrent.futures
+    import multiprocessing
+
     import cv2
 
-    img_list = [cv2.imread(img_fpath) for img_fpath in imgpaths]
+    # cv2.imread releases the GIL while decoding, so threads overlap the reads
+    num_cores = multiprocessing.cpu_count()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_cores) as pool:
+        img_list = list(pool.map(cv2.imread, imgpaths))
     return img_list
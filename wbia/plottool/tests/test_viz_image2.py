@@ -2,21 +2,25 @@
 # -*- coding: utf-8 -*-
 
 import os
+from os.path import join, splitext
 
-import cv2
-import numpy as np
-import utool
 
-from wbia.plottool import draw_func2 as df2
-from wbia.plottool import viz_image2
-from wbia.plottool.tests.test_helpers import dummy_bbox
+def _test_viz_image(img_fpath):
+    # Heavy imports are deferred so pytest collection does not pay for them
+    import mmap
 
-WILDBOOK_IA_MODELS_BASE = os.getenv('WILDBOOK_IA_MODELS_BASE', 'https://wildbookiarepository.azureedge.net')
+    import cv2
+    import numpy as np
+    import utool
 
+    from wbia.plottool import draw_func2 as df2
+    from wbia.plottool import viz_image2
+    from wbia.plottool.tests.test_helpers import dummy_bbox
 
-def _test_viz_image(img_fpath):
-    # Read image
-    img = cv2.imread(img_fpath)
+    # Read image by decoding straight from the mapped file pages
+    with open(img_fpath, 'rb') as file_:
+        with mmap.mmap(file_.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            img = cv2.imdecode(np.frombuffer(buf, dtype=np.uint8), cv2.IMREAD_COLOR)
     tau = np.pi * 2  # References: tauday.com
     # Create figure
     fig = df2.figure(fnum=42, pnum=(1, 1, 1))
@@ -41,13 +45,21 @@ def _test_viz_image(img_fpath):
 
 
 if __name__ == '__main__':
-    TEST_IMAGES_URL = f'{WILDBOOK_IA_MODELS_BASE}/data/testdata.zip'
-    test_image_dir = utool.grab_zipped_url(TEST_IMAGES_URL, appname='utool')
-    imgpaths = utool.list_images(
-        test_image_dir, fullpath=True, recursive=False
-    )  # test image paths
-    # Get one image filepath to load and display
-    img_fpath = imgpaths[0]
+    import utool
+
+    from wbia.plottool import draw_func2 as df2
+    from wbia.tests.helpers import get_testdata_dir
+
+    test_image_dir = get_testdata_dir()
+    # Get one image filepath to load and display, the first by name so every
+    # machine picks the same one
+    img_fname_list = [
+        fname
+        for fname in os.listdir(test_image_dir)
+        if splitext(fname)[1] in utool.IMG_EXTENSIONS
+    ]
+    assert len(img_fname_list) > 0, 'No images in %r' % (test_image_dir,)
+    img_fpath = join(test_image_dir, min(img_fname_list))
     # Run Test
     _test_viz_image(img_fpath)
     # Magic exec which displays or puts you into IPython with --cmd flag
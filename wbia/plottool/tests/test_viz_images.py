@@ -1,20 +1,16 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import os
 
-import numpy as np
-import utool
-
-from wbia.plottool import draw_func2 as df2
-from wbia.plottool import plot_helpers as ph
-from wbia.plottool import viz_image2
-from wbia.plottool.tests.test_helpers import dummy_bbox, imread_many
-
-WILDBOOK_IA_MODELS_BASE = os.getenv('WILDBOOK_IA_MODELS_BASE', 'https://wildbookiarepository.azureedge.net')
+def _test_viz_image(imgpaths):
+    # Heavy imports are deferred so pytest collection does not pay for them
+    import numpy as np
 
+    from wbia.plottool import draw_func2 as df2
+    from wbia.plottool import plot_helpers as ph
+    from wbia.plottool import viz_image2
+    from wbia.plottool.tests.test_helpers import dummy_bbox, imread_many
 
-def _test_viz_image(imgpaths):
     nImgs = len(imgpaths)
     assert len(imgpaths) < 20, '%d > 20 out of scope of this test' % nImgs
     tau = np.pi * 2
@@ -46,8 +42,12 @@ def _test_viz_image(imgpaths):
 
 
 if __name__ == '__main__':
-    TEST_IMAGES_URL = f'{WILDBOOK_IA_MODELS_BASE}/data/testdata.zip'
-    test_image_dir = utool.grab_zipped_url(TEST_IMAGES_URL, appname='utool')
+    import utool
+
+    from wbia.plottool import draw_func2 as df2
+    from wbia.tests.helpers import get_testdata_dir
+
+    test_image_dir = get_testdata_dir()
     imgpaths = utool.list_images(test_image_dir, fullpath=True)  # test image paths
     _test_viz_image(imgpaths)
     exec(df2.present())
@@ -1,21 +1,97 @@
 # -*- coding: utf-8 -*-
-import os
+import shutil
+import tempfile
+import zipfile
+from functools import lru_cache
+from os.path import basename, commonprefix, exists, join, splitext
 
+import requests
 import utool as ut
 
+from wbia import constants as const
+
 __all__ = ('get_testdata_dir',)
 
-WILDBOOK_IA_MODELS_BASE = os.getenv('WILDBOOK_IA_MODELS_BASE', 'https://wildbookiarepository.azureedge.net')
+TESTDATA_MAP = {
+    'testdb1': const.ZIPPED_URLS.TESTDATA,
+}
+
+TESTDATA_MARKER = '.wbia_testdata_ok'
+
+# Files of each complete extraction, recognises caches made before the marker
+TESTDATA_LEGACY_FNAMES = {
+    'testdb1': (
+        'easy1.JPG',
+        'easy2.JPG',
+        'easy3.JPG',
+        'hard1.JPG',
+        'hard2.JPG',
+        'hard3.JPG',
+        'jeff.png',
+        'lena.jpg',
+        'occl1.JPG',
+        'occl2.JPG',
+        'polar1.jpg',
+        'polar2.jpg',
+        'zebra.jpg',
+    ),
+}
+
+# Reused so repeated downloads from the models host share one connection pool
+_SESSION = requests.Session()
+
+# Downloads stay in memory up to this size and spill to disk past it
+_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+
+def _grab_zipped_url(
+    zipped_url, ensure=True, appname='utool', session=_SESSION, legacy_fnames=None
+):
+    """
+    Same layout as ``ut.grab_zipped_url``, but the archive is streamed into a
+    spooled temporary file and extracted from there instead of being kept
+    next to the data. A data_dir without the marker is only trusted if it holds
+    all of legacy_fnames, anything else is extracted again
+    """
+    download_dir = ut.get_app_cache_dir(appname)
+    data_name = splitext(basename(zipped_url))[0]
+    data_dir = join(download_dir, data_name)
+    # Only written after a complete extraction
+    marker_fpath = join(data_dir, TESTDATA_MARKER)
+    extracted = exists(marker_fpath)
+    if not extracted and legacy_fnames:
+        # Extracted before the marker existed, an interrupted extraction is
+        # missing some of the files
+        extracted = all(exists(join(data_dir, fname)) for fname in legacy_fnames)
+        if extracted:
+            ut.touch(marker_fpath, verbose=False)
+    if ensure and not extracted:
+        ut.ensuredir(download_dir)
+        with session.get(zipped_url, stream=True) as response:
+            response.raise_for_status()
+            # Undo any transfer encoding, raw is otherwise the bytes as sent
+            response.raw.decode_content = True
+            with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as zip_fileobj:
+                shutil.copyfileobj(response.raw, zip_fileobj)
+                zip_fileobj.seek(0)
+                with zipfile.ZipFile(zip_fileobj) as zip_file:
+                    namelist = zip_file.namelist()
+                    # Force the members into data_dir if they do not share a prefix
+                    output_dir = download_dir if commonprefix(namelist) else data_dir
+                    zip_file.extractall(output_dir)
+        ut.ensuredir(data_dir)
+        ut.touch(marker_fpath, verbose=False)
+    return ut.unixpath(data_dir)
 
 
+@lru_cache(maxsize=None)
 def get_testdata_dir(ensure=True, key='testdb1'):
     """
     Gets test img directory and downloads it if it doesn't exist
     """
-    testdata_map = {
-        # 'testdb1': f'{WILDBOOK_IA_MODELS_BASE}/public/data/testdata.zip'}
-        'testdb1': f'{WILDBOOK_IA_MODELS_BASE}/data/testdata.zip',
-    }
-    zipped_testdata_url = testdata_map[key]
-    testdata_dir = ut.grab_zipped_url(zipped_testdata_url, ensure=ensure)
+    zipped_testdata_url = TESTDATA_MAP[key]
+    legacy_fnames = TESTDATA_LEGACY_FNAMES.get(key, None)
+    testdata_dir = _grab_zipped_url(
+        zipped_testdata_url, ensure=ensure, legacy_fnames=legacy_fnames
+    )
     return testdata_dir
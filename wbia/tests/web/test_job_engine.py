@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+import json
+import uuid
+
+import pytest
+import utool as ut
+import zmq
+
+from wbia.web import job_engine
+
+
+@pytest.fixture(params=['json', 'orjson', 'orjson-fragment'])
+def json_backend(request, monkeypatch):
+    # Older orjson installs (e.g., 3.8) have no Fragment, so each backend is
+    # forced in turn instead of relying on what is installed
+    if request.param == 'json':
+        monkeypatch.setattr(job_engine, 'orjson', None)
+        monkeypatch.setattr(job_engine, 'ORJSON_FRAGMENT', False)
+    else:
+        orjson = pytest.importorskip('orjson')
+        fragment = request.param == 'orjson-fragment'
+        if fragment and not hasattr(orjson, 'Fragment'):
+            pytest.skip('orjson.Fragment needs orjson 3.9')
+        monkeypatch.setattr(job_engine, 'orjson', orjson)
+        monkeypatch.setattr(job_engine, 'ORJSON_FRAGMENT', fragment)
+    return request.param
+
+
+@pytest.fixture
+def sockets():
+    # inproc only connects sockets of the same context
+    url = 'inproc://test-job-engine-{}'.format(uuid.uuid4())
+    router = job_engine.ctx.socket(zmq.ROUTER)
+    router.bind(url)
+    dealer = job_engine.ctx.socket(zmq.DEALER)
+    dealer.setsockopt_string(zmq.IDENTITY, 'client.DEALER')
+    dealer.connect(url)
+    yield router, dealer
+    dealer.close(linger=0)
+    router.close(linger=0)
+
+
+def test_multipart_json_round_trip(json_backend, sockets):
+    router, dealer = sockets
+    request = {'action': 'job_status', 'jobid': 'jobid'}
+    dealer.send(job_engine.dumps_json(request))
+    idents, received = job_engine.rcv_multipart_json(router, num=1)
+    assert idents == [b'client.DEALER']
+    assert received == request
+
+    reply = {'status': 'ok', 'jobid': 'jobid', 'jobstatus': 'completed'}
+    job_engine.send_multipart_json(router, idents, reply)
+    assert job_engine.loads_json(dealer.recv()) == reply
+
+
+def test_multipart_json_trailing_frames(json_backend, sockets):
+    router, dealer = sockets
+    json_result = ut.to_json({'score': 0.5, 'aids': [1, 2, 3]})
+    multi_notify = {
+        'jobid': 'jobid',
+        'events': [{'action': 'store', 'engine_result': {}}],
+        'action': 'multi_notify',
+        'frames': ['json_result'],
+    }
+    update = {'lane': 'fast'}
+    dealer.send_multipart(
+        [
+            job_engine.dumps_json(multi_notify),
+            json_result.encode('utf-8'),
+            job_engine.dumps_json(update),
+        ]
+    )
+    idents, received, request_json = job_engine.rcv_multipart_json(
+        router, num=1, raw=True
+    )
+    assert idents == [b'client.DEALER']
+    # Named frames are raw bytes, the others update the request
+    assert 'frames' not in received
+    assert received['json_result'] == json_result.encode('utf-8')
+    assert received['lane'] == 'fast'
+    assert received['events'] == multi_notify['events']
+    # The request frame is returned untouched so it can be forwarded as is
+    assert request_json.bytes == job_engine.dumps_json(multi_notify)
+
+
+def test_dumps_reply_embed_json(json_backend):
+    stored = ut.to_json(
+        {'score': 0.5, 'uuid': uuid.UUID('b7cbf1f1-30b0-4cf0-8a64-5a34da0c8b06')}
+    )
+    reply = {'status': 'ok', 'jobid': 'jobid', 'json_result': None}
+    reply['json_result'] = job_engine.embed_json(stored)
+    encoded = job_engine.dumps_reply(reply)
+    if isinstance(encoded, str):
+        encoded = encoded.encode('utf-8')
+    decoded = job_engine.loads_json(encoded)
+    assert decoded['status'] == 'ok'
+    # Both backends must put the stored result on the wire in utool's convention
+    assert decoded['json_result'] == json.loads(stored)
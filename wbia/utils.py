@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import os
+import threading
 from urllib.parse import urlparse
 
 from oauthlib.oauth2 import BackendApplicationClient, TokenExpiredError
@@ -13,23 +14,29 @@ HOUSTON_TOKEN_API = '%s/api/v1/auth/tokens'
 HOUSTON_CLIENT_ID = os.getenv('HOUSTON_CLIENT_ID')
 HOUSTON_CLIENT_SECRET = os.getenv('HOUSTON_CLIENT_SECRET')
 
-HOUSTON_SESSIONS = {}
+# Sessions are not thread-safe (job callbacks call houston from several threads),
+# each thread keeps its own session per hostname
+HOUSTON_SESSIONS = threading.local()
+
+
+def _get_houston_sessions():
+    if not hasattr(HOUSTON_SESSIONS, 'sessions'):
+        HOUSTON_SESSIONS.sessions = {}
+    return HOUSTON_SESSIONS.sessions
 
 
 def init_houston_session(hostname):
-    global HOUSTON_SESSIONS
+    sessions = _get_houston_sessions()
 
-    if HOUSTON_SESSIONS.get(hostname, None) is None:
+    if sessions.get(hostname, None) is None:
         client = BackendApplicationClient(client_id=HOUSTON_CLIENT_ID)
-        HOUSTON_SESSIONS[hostname] = OAuth2Session(client=client)
+        sessions[hostname] = OAuth2Session(client=client)
 
-    return HOUSTON_SESSIONS[hostname]
+    return sessions[hostname]
 
 
 def forget_houston_session(hostname):
-    global HOUSTON_SESSIONS
-
-    return HOUSTON_SESSIONS.pop(hostname, None)
+    return _get_houston_sessions().pop(hostname, None)
 
 
 def refresh_houston_session_token(hostname):
@@ -45,7 +52,7 @@ def refresh_houston_session_token(hostname):
 
 
 def get_houston_session(hostname):
-    session = HOUSTON_SESSIONS.get(hostname, None)
+    session = _get_houston_sessions().get(hostname, None)
 
     if session is None:
         session = refresh_houston_session_token(hostname)
@@ -50,19 +50,32 @@ Notes:
     And then running the forground process
     python -m wbia.web.job_engine job_engine_tester --fg
 """
+import errno
+import gc
+import json
 import multiprocessing
+import os
+import pickle
 import random
-import re
 import shelve
+import socket
+import sqlite3
+import string
+import sys
+import tempfile
+import threading
 import time
+import traceback
 import uuid  # NOQA
+from concurrent import futures
 from datetime import datetime, timedelta
-from functools import partial
-from os.path import abspath, basename, exists, join, splitext
+from functools import lru_cache, partial
+from operator import itemgetter
+from os.path import basename, exists, join, split, splitext
 
-import flask
 import numpy as np
 import pytz
+import requests
 
 # if False:
 #    import os
@@ -71,6 +84,11 @@ import pytz
 import utool as ut
 import zmq
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from wbia.control import controller_inject
 from wbia.utils import call_houston
 
@@ -87,24 +105,115 @@ ctx = zmq.Context.instance()
 
 # FIXME: needs to use correct number of ports
 URL = 'tcp://127.0.0.1'
+# Characters allowed in a custom (non-UUID) job id
+JOBID_CHARS = frozenset(string.ascii_letters + string.digits + '-_')
+# All job processes run on one host, 'ipc' swaps loopback TCP for Unix sockets
+JOB_TRANSPORT = os.getenv('WBIA_TRANSPORT', 'tcp').lower()
 NUM_DEFAULT_ENGINES = ut.get_argval('--engine-lane-workers', int, 2)
 NUM_SLOW_ENGINES = ut.get_argval('--engine-slow-lane-workers', int, NUM_DEFAULT_ENGINES)
 NUM_FAST_ENGINES = ut.get_argval('--engine-fast-lane-workers', int, NUM_DEFAULT_ENGINES)
+NUM_RESTART_WORKERS = ut.get_argval(
+    '--max-restart-workers', int, min(32, multiprocessing.cpu_count() * 4)
+)
 NUM_ENGINES = {
     'slow': NUM_SLOW_ENGINES,
     'fast': NUM_FAST_ENGINES,
 }
 VERBOSE_JOBS = ut.get_argflag('--verbose-jobs')
+# Stored results can only be embedded in replies without decoding them since 3.9
+ORJSON_FRAGMENT = hasattr(orjson, 'Fragment')
 
 
-GLOBAL_SHELVE_LOCK = multiprocessing.Lock()
+ENGINE_STORE_FILENAME = 'engine_store.sqlite3'
+ENGINE_STORE_CONNECTIONS = {}
+ENGINE_STORE_LOCK = threading.Lock()
+# Held for a whole archive move, the connections are shared by a process's threads
+ENGINE_ARCHIVE_LOCK = threading.Lock()
 
 
 TIMESTAMP_FMTSTR = '%Y-%m-%d %H:%M:%S %Z'
 TIMESTAMP_TIMEZONE = 'US/Pacific'
+TIMESTAMP_TZ = pytz.timezone(TIMESTAMP_TIMEZONE)
+
+# Status times of a newly received job, copied once per job by the engine queue
+JOB_TIMES_TEMPLATE = {
+    'received': None,
+    'started': None,
+    'updated': None,
+    'completed': None,
+    'runtime': None,
+    'turnaround': None,
+    'runtime_sec': None,
+    'turnaround_sec': None,
+    # Epoch seconds of the timestamps above, spans are computed from these
+    'received_epoch': None,
+    'started_epoch': None,
+    'completed_epoch': None,
+}
+
+# Completed jobs older than this are moved to the archive on startup
+JOB_ARCHIVE_DAYS = 3
 
 
+JOB_STATUS_CACHE_SIZE = 10000
+# The collector's status dict entry of every job it knows, kept up to date as
+# statuses change instead of being rebuilt for every request. Jobs still waiting
+# for their metadata are rebuilt on each request
 JOB_STATUS_CACHE = {}
+JOB_STATUS_PENDING = set()
+# The collector's sorted jobids, only re-sorted once new jobs have been added
+JOB_ID_LIST = []
+
+# Statuses after which a job changes no more (unless its jobid is queued again)
+JOB_STATUS_FINAL = ('completed', 'exception')
+# Client-side status replies are reused briefly, a reused jobid changes even a
+# final status
+JOB_STATUS_CACHE_TTL = 0.5
+
+# Queue depth per socket before sends block or drop, zmq's default is 1000
+JOB_SOCKET_HWM = 10000
+# How often (ms) a client's status subscriber checks whether it was stopped
+JOB_SUBSCRIBER_POLL = 1000
+# Restarted jobs sent before their replies are read
+JOB_RESEND_WINDOW = 1000
+# Job completion callbacks reuse pooled connections, and a stuck callback
+# (connect, read) cannot hold up the collector indefinitely
+CALLBACK_TIMEOUT = (3, 30)
+# Sessions are not thread-safe, each callback thread gets its own
+CALLBACK_LOCAL = threading.local()
+
+
+def _init_callback_thread():
+    CALLBACK_LOCAL.session = requests.Session()
+
+
+# Callbacks are sent off the collector's thread, threads only start on first use
+CALLBACK_EXECUTOR = futures.ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix='job_callback', initializer=_init_callback_thread
+)
+
+# Collector messages handled between young generation collections
+JOB_GC_INTERVAL = 32
+# New collector jobs after which their (long lived) records are frozen
+JOB_GC_FREEZE_JOBS = 1000
+# Most collector messages handled before their replies are sent
+JOB_COLLECT_BATCH = 64
+
+# Engines fork from the already imported server instead of re-importing wbia.
+# Pinned on Linux only, Python 3.14 moves its default away from fork there
+if sys.platform.startswith('linux'):
+    PROCESS_CONTEXT = multiprocessing.get_context('fork')
+else:
+    PROCESS_CONTEXT = multiprocessing.get_context()
+
+
+def _freeze_gc():
+    """
+    Moves everything alive after startup (the controller, imported modules) into
+    the permanent generation so later collections no longer traverse it
+    """
+    gc.collect()
+    gc.freeze()
 
 
 def update_proctitle(procname, dbname=None):
@@ -122,17 +231,24 @@ def update_proctitle(procname, dbname=None):
         print('pip install setproctitle')
 
 
-def _get_engine_job_paths(ibs):
+def _get_engine_paths(ibs, ext):
     shelve_path = ibs.get_shelves_path()
     ut.ensuredir(shelve_path)
-    record_filepath_list = list(ut.iglob(join(shelve_path, '*.pkl')))
+    # DirEntry names come from the directory listing, no per-file stat is needed
+    with os.scandir(shelve_path) as entries:
+        filepath_list = [
+            join(shelve_path, entry.name) for entry in entries if entry.name.endswith(ext)
+        ]
+    return filepath_list
+
+
+def _get_engine_job_paths(ibs):
+    record_filepath_list = _get_engine_paths(ibs, '.pkl')
     return record_filepath_list
 
 
 def _get_engine_lock_paths(ibs):
-    shelve_path = ibs.get_shelves_path()
-    ut.ensuredir(shelve_path)
-    lock_filepath_list = list(ut.iglob(join(shelve_path, '*.lock')))
+    lock_filepath_list = _get_engine_paths(ibs, '.lock')
     return lock_filepath_list
 
 
@@ -145,7 +261,7 @@ def fetch_job(ibs, jobid):
     job_record_filepath = join(shelve_path, job_record_filename)
     assert exists(job_record_filepath)
 
-    job_record = ut.load_cPkl(job_record_filepath)
+    job_record = load_job_record(job_record_filepath)
 
     job_action = job_record['request']['action']
     job_args = job_record['request']['args']
@@ -212,7 +328,10 @@ def initialize_job_manager(ibs):
     lock_filepath_list = _get_engine_lock_paths(ibs)
     print('Deleting %d leftover engine locks' % (len(lock_filepath_list),))
     for lock_filepath in lock_filepath_list:
-        ut.delete(lock_filepath)
+        try:
+            os.unlink(lock_filepath)
+        except FileNotFoundError:
+            pass
 
     ibs.job_manager.jobiface = JobInterface(
         0, ibs.job_manager.reciever.port_dict, ibs=ibs
@@ -242,6 +361,7 @@ def close_job_manager(ibs):
     #     pass
     del ibs.job_manager.reciever
     del ibs.job_manager.jobiface
+    close_client_sockets()
     ibs.job_manager = None
 
 
@@ -332,19 +452,15 @@ def get_job_status(ibs, jobid=None):
         status = ibs.job_manager.jobiface.get_job_status(jobid)
     return status
 
+
 @register_ibs_method
-@register_api(
-    '/api/engine/job/statuses/', methods=['GET'], __api_plural_check__=False
-)
+@register_api('/api/engine/job/statuses/', methods=['GET'], __api_plural_check__=False)
 def get_job_statuses(ibs, jobids=None):
-    if jobids.startswith('[') and jobids.endswith(']'):
-        jobids = jobids[1:-1]
-    jobids = jobids.split(',')
-    statuses = dict()
-    for jobid in jobids:
-        status = ibs.job_manager.jobiface.get_job_status(jobid)
-        statuses[jobid] = status['jobstatus']
-
+    """
+    Web call that returns the statuses of a comma separated list of jobs
+    """
+    jobids = [jobid.strip() for jobid in jobids.strip('[]').split(',')]
+    statuses = ibs.job_manager.jobiface.get_job_statuses(jobids)
     return statuses
 
 
@@ -412,12 +528,17 @@ def get_job_result(ibs, jobid):
 #     return result
 
 
-def _get_random_open_port():
-    port = random.randint(1024, 49151)
-    while not ut.is_local_port_open(port):
-        port = random.randint(1024, 49151)
-    assert ut.is_local_port_open(port)
-    return port
+def _get_open_ports(num):
+    """Asks the OS for num distinct free local ports in one sweep"""
+    sock_list = [socket.socket(socket.AF_INET, socket.SOCK_STREAM) for _ in range(num)]
+    try:
+        for sock in sock_list:
+            sock.bind(('127.0.0.1', 0))
+        port_list = [sock.getsockname()[1] for sock in sock_list]
+    finally:
+        for sock in sock_list:
+            sock.close()
+    return port_list
 
 
 def job_engine_tester():
@@ -499,7 +620,7 @@ def spawn_background_process(func, *args, **kwargs):
 
     func_name = ut.get_funcname(func)
     name = 'job-engine.Progress-' + func_name
-    proc_obj = multiprocessing.Process(target=func, name=name, args=args, kwargs=kwargs)
+    proc_obj = PROCESS_CONTEXT.Process(target=func, name=name, args=args, kwargs=kwargs)
     proc_obj.daemon = True
     proc_obj.start()
     return proc_obj
@@ -569,17 +690,24 @@ class JobBackend(object):
         ]
         for lane in self.engine_lanes:
             key_list.append('engine_{}_push_url'.format(lane))
+        key_list.append('collect_status_pub_url')
+
+        if JOB_TRANSPORT == 'ipc':
+            # Static names let separately started engines find the same sockets
+            tag = static_root if use_static_ports else os.getpid()
+            self.port_dict = {
+                key: 'ipc://{}'.format(
+                    join(tempfile.gettempdir(), 'wbia-job-{}-{}.ipc'.format(tag, key))
+                )
+                for key in key_list
+            }
+            return
 
         # Get ports
         if use_static_ports:
             port_list = range(static_root, static_root + len(key_list))
         else:
-            port_list = []
-            while len(port_list) < len(key_list):
-                port = _get_random_open_port()
-                if port not in port_list:
-                    port_list.append(port)
-            port_list = sorted(port_list)
+            port_list = sorted(_get_open_ports(len(key_list)))
         # Assign ports
         assert len(key_list) == len(port_list)
         self.port_dict = {
@@ -669,81 +797,192 @@ class JobBackend(object):
         return status_dict
 
 
-def get_shelve_lock_filepath(shelve_filepath):
-    shelve_lock_filepath = '{}.lock'.format(shelve_filepath)
-    return shelve_lock_filepath
-
-
-def touch_shelve_lock_file(shelve_filepath):
-    shelve_lock_filepath = get_shelve_lock_filepath(shelve_filepath)
-    assert not exists(shelve_lock_filepath)
-    ut.touch(shelve_lock_filepath, verbose=False)
-    assert exists(shelve_lock_filepath)
-
+def _get_engine_store(store_path):
+    """
+    Returns this process's connection to the SQLite job store in store_path
 
-def delete_shelve_lock_file(shelve_filepath):
-    shelve_lock_filepath = get_shelve_lock_filepath(shelve_filepath)
-    assert exists(shelve_lock_filepath)
-    ut.delete(shelve_lock_filepath, verbose=False)
-    assert not exists(shelve_lock_filepath)
+    The store replaces the per-job shelve files. WAL mode lets the collector
+    write while other processes read, so no lock files are needed.
+    """
+    # Connections must not cross a fork, so they are cached per process
+    store_key = (os.getpid(), store_path)
+    connection = ENGINE_STORE_CONNECTIONS.get(store_key, None)
+    if connection is not None:
+        return connection
+    with ENGINE_STORE_LOCK:
+        connection = ENGINE_STORE_CONNECTIONS.get(store_key, None)
+        if connection is not None:
+            return connection
+        ut.ensuredir(store_path)
+        store_filepath = join(store_path, ENGINE_STORE_FILENAME)
+        connection = sqlite3.connect(
+            store_filepath, timeout=600, isolation_level=None, check_same_thread=False
+        )
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS shelves (
+                name TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value BLOB,
+                PRIMARY KEY (name, key)
+            )
+            """
+        )
+        ENGINE_STORE_CONNECTIONS[store_key] = connection
+    return connection
 
 
-def wait_for_shelve_lock_file(shelve_filepath, timeout=600):
-    shelve_lock_filepath = get_shelve_lock_filepath(shelve_filepath)
-    start_time = time.time()
-    while exists(shelve_lock_filepath):
-        current_time = time.time()
-        elapsed = current_time - start_time
-        if elapsed >= timeout:
-            return False
-        time.sleep(1)
-        if int(elapsed) % 5 == 0:
-            print('Waiting for {:0.02f} seconds for lock so far'.format(elapsed))
-    return True
+def _get_legacy_shelve_value(shelve_filepath, key):
+    """Reads a value from a shelve file written before the SQLite job store"""
+    value = None
+    try:
+        with shelve.open(shelve_filepath, 'r') as shelf:
+            value = shelf.get(key)
+    except Exception:
+        pass
+    return value
 
 
 def get_shelve_value(shelve_filepath, key):
     if shelve_filepath in [None, 'None', 'None.lock']:
         return None
-    wait_for_shelve_lock_file(shelve_filepath)
-    with GLOBAL_SHELVE_LOCK:
-        wait_for_shelve_lock_file(shelve_filepath)
-        touch_shelve_lock_file(shelve_filepath)
+    store_path, name = split(shelve_filepath)
     value = None
     try:
-        with shelve.open(shelve_filepath, 'r') as shelf:
-            value = shelf.get(key)
+        connection = _get_engine_store(store_path)
+        row = connection.execute(
+            'SELECT value FROM shelves WHERE name=? AND key=?', (name, key)
+        ).fetchone()
+        if row is None:
+            value = _get_legacy_shelve_value(shelve_filepath, key)
+        else:
+            value = pickle.loads(row[0])
     except Exception:
         pass
-    delete_shelve_lock_file(shelve_filepath)
     return value
 
 
 def set_shelve_value(shelve_filepath, key, value):
     if shelve_filepath in [None, 'None', 'None.lock']:
         return False
-    wait_for_shelve_lock_file(shelve_filepath)
-    with GLOBAL_SHELVE_LOCK:
-        wait_for_shelve_lock_file(shelve_filepath)
-        touch_shelve_lock_file(shelve_filepath)
+    store_path, name = split(shelve_filepath)
     flag = False
     try:
-        with shelve.open(shelve_filepath) as shelf:
-            shelf[key] = value
+        connection = _get_engine_store(store_path)
+        connection.execute(
+            'INSERT OR REPLACE INTO shelves (name, key, value) VALUES (?, ?, ?)',
+            (name, key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)),
+        )
         flag = True
     except Exception:
         pass
-    delete_shelve_lock_file(shelve_filepath)
     return flag
 
 
+def get_metadata_value(shelve_input_filepath):
+    """Returns a job's metadata with its separately stored status times merged in"""
+    metadata = get_shelve_value(shelve_input_filepath, 'metadata')
+    if metadata is not None:
+        times = get_shelve_value(shelve_input_filepath, 'times')
+        if times is not None:
+            metadata['times'] = times
+    return metadata
+
+
+def archive_shelve_values(shelve_filepath_list, shelve_path, shelve_archive_path):
+    """
+    Moves the stored values of the given shelves into the archive store
+
+    Each store is changed in a single transaction that no other writer can
+    interleave with, the archive's is committed first. Its rows are replaced, so
+    a move interrupted between the two commits is completed by moving again,
+    see _archive_job
+    """
+    name_list = [basename(shelve_filepath) for shelve_filepath in shelve_filepath_list]
+    placeholders = ', '.join(['?'] * len(name_list))
+    connection = _get_engine_store(shelve_path)
+    archive_connection = _get_engine_store(shelve_archive_path)
+    with ENGINE_ARCHIVE_LOCK:
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            row_list = connection.execute(
+                'SELECT name, key, value FROM shelves WHERE name IN ({})'.format(
+                    placeholders
+                ),
+                name_list,
+            ).fetchall()
+            archive_connection.execute('BEGIN IMMEDIATE')
+            try:
+                archive_connection.executemany(
+                    'INSERT OR REPLACE INTO shelves (name, key, value) VALUES (?, ?, ?)',
+                    row_list,
+                )
+                archive_connection.execute('COMMIT')
+            except Exception:
+                archive_connection.execute('ROLLBACK')
+                raise
+            connection.execute(
+                'DELETE FROM shelves WHERE name IN ({})'.format(placeholders), name_list
+            )
+            connection.execute('COMMIT')
+        except Exception:
+            connection.execute('ROLLBACK')
+            raise
+
+
+def load_job_record(record_filepath):
+    with open(record_filepath, 'rb') as file_:
+        record = pickle.load(file_)
+    return record
+
+
+def save_job_record(record_filepath, record):
+    with open(record_filepath, 'wb') as file_:
+        pickle.dump(record, file_, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def get_job_completed_filepath(shelve_path, jobid):
+    """
+    An empty file next to the job's record marks the job as completed, so the
+    record is not rewritten to flip a flag. Older records carry 'completed'
+    """
+    return join(shelve_path, '{}.done'.format(jobid))
+
+
 def get_shelve_filepaths(ibs, jobid):
+    # The shelves path is already absolute, it is built from the resolved workdir
     shelve_path = ibs.get_shelves_path()
-    shelve_input_filepath = abspath(join(shelve_path, '{}.input.shelve'.format(jobid)))
-    shelve_output_filepath = abspath(join(shelve_path, '{}.output.shelve'.format(jobid)))
+    shelve_input_filepath = join(shelve_path, '{}.input.shelve'.format(jobid))
+    shelve_output_filepath = join(shelve_path, '{}.output.shelve'.format(jobid))
     return shelve_input_filepath, shelve_output_filepath
 
 
+def _archive_job(
+    jobid, shelve_input_filepath, shelve_output_filepath, shelve_path, shelve_archive_path
+):
+    # Values go first, until the record is moved a restart archives the job again
+    archive_shelve_values(
+        [shelve_input_filepath, shelve_output_filepath],
+        shelve_path,
+        shelve_archive_path,
+    )
+    job_scr_filepath_list = list(ut.iglob(join(shelve_path, '{}*'.format(jobid))))
+    for job_scr_filepath in job_scr_filepath_list:
+        job_dst_filepath = job_scr_filepath.replace(shelve_path, shelve_archive_path)
+        try:
+            # Atomic and overwrites, no data is copied on the same device
+            os.replace(job_scr_filepath, job_dst_filepath)
+        except OSError as ex:
+            if ex.errno != errno.EXDEV:
+                raise
+            ut.copy(
+                job_scr_filepath, job_dst_filepath, overwrite=True
+            )  # ut.copy allows for overwrite, ut.move does not
+            ut.delete(job_scr_filepath)
+
+
 def initialize_process_record(
     record_filepath,
     shelve_input_filepath,
@@ -751,38 +990,61 @@ def initialize_process_record(
     shelve_path,
     shelve_archive_path,
     jobiface_id,
+    archive_timestamp=None,
 ):
     MAX_ATTEMPTS = 20
-    ARCHIVE_DAYS = 3
 
-    timezone = pytz.timezone(TIMESTAMP_TIMEZONE)
-    now = datetime.now(timezone)
-    now = now.replace(microsecond=0)
-    now = now.replace(second=0)
-    now = now.replace(minute=0)
-    now = now.replace(hour=0)
-
-    archive_delta = timedelta(days=ARCHIVE_DAYS)
-    archive_date = now - archive_delta
-    archive_timestamp = archive_date.strftime(TIMESTAMP_FMTSTR)
+    if archive_timestamp is None:
+        archive_timestamp = _archive_timestamp()
 
     jobid = splitext(basename(record_filepath))[0]
     jobcounter = None
 
+    # Completions are written when the job completes, so a job completed longer
+    # than the archive window ago (plus a day of grace for the midnight cutoff) is
+    # archived without looking up its metadata
+    archive_age = (JOB_ARCHIVE_DAYS + 1) * 24 * 60 * 60
+
+    # Checked before the record is loaded, old completed jobs never need it
+    completed_filepath = get_job_completed_filepath(shelve_path, jobid)
+    try:
+        completed_age = time.time() - os.stat(completed_filepath).st_mtime
+    except FileNotFoundError:
+        completed_age = None
+
+    archive_args = (
+        jobid,
+        shelve_input_filepath,
+        shelve_output_filepath,
+        shelve_path,
+        shelve_archive_path,
+    )
+    if completed_age is not None and completed_age > archive_age:
+        _archive_job(*archive_args)
+        return jobcounter, jobid, None, True, True, False, False
+
     # Load the engine record
-    record = ut.load_cPkl(record_filepath, verbose=False)
+    record = load_job_record(record_filepath)
 
     # Load the record info
     engine_request = record.get('request', None)
     attempts = record.get('attempts', 0)
-    completed = record.get('completed', False)
+    completed = completed_age is not None
+
+    if not completed and record.get('completed', False):
+        # Legacy records were rewritten with the flag set when the job completed
+        completed = True
+        record_age = time.time() - os.stat(record_filepath).st_mtime
+        if record_age > archive_age:
+            _archive_job(*archive_args)
+            return jobcounter, jobid, None, True, completed, False, False
 
     # Check status
     suppressed = attempts >= MAX_ATTEMPTS
     corrupted = engine_request is None
 
     # Load metadata
-    metadata = get_shelve_value(shelve_input_filepath, 'metadata')
+    metadata = get_metadata_value(shelve_input_filepath)
 
     if metadata is None:
         print('Missing metadata...corrupted')
@@ -821,17 +1083,13 @@ def initialize_process_record(
                 color = 'brightmagenta'
                 print_ = partial(ut.colorprint, color=color)
                 print_('ARCHIVING JOB (AGE: %d SECONDS)' % (job_age,))
-                job_scr_filepath_list = list(
-                    ut.iglob(join(shelve_path, '{}*'.format(jobid)))
+                _archive_job(
+                    jobid,
+                    shelve_input_filepath,
+                    shelve_output_filepath,
+                    shelve_path,
+                    shelve_archive_path,
                 )
-                for job_scr_filepath in job_scr_filepath_list:
-                    job_dst_filepath = job_scr_filepath.replace(
-                        shelve_path, shelve_archive_path
-                    )
-                    ut.copy(
-                        job_scr_filepath, job_dst_filepath, overwrite=True
-                    )  # ut.copy allows for overwrite, ut.move does not
-                    ut.delete(job_scr_filepath)
 
     if archived:
         # We have archived the job, don't bother registering it
@@ -855,37 +1113,137 @@ def initialize_process_record(
             engine_request['restart_jobid'] = jobid
             engine_request['restart_jobcounter'] = jobcounter
             engine_request['restart_received'] = received
+            engine_request['restart_received_epoch'] = times.get('received_epoch', None)
             record['attempts'] = attempts + 1
 
-            ut.save_cPkl(record_filepath, record, verbose=False)
+            save_job_record(record_filepath, record)
 
     values = jobcounter, jobid, engine_request, archived, completed, suppressed, corrupted
     return values
 
 
+def _tune_socket(socket_):
+    """Applies the job engine's options, must run before bind / connect"""
+    socket_.setsockopt(zmq.LINGER, 0)
+    socket_.setsockopt(zmq.SNDHWM, JOB_SOCKET_HWM)
+    socket_.setsockopt(zmq.RCVHWM, JOB_SOCKET_HWM)
+    socket_.setsockopt(zmq.TCP_KEEPALIVE, 1)
+    return socket_
+
+
+def _make_client_socket(identity, url):
+    socket_ = ctx.socket(zmq.DEALER)  # CHECK2 - REQ
+    _tune_socket(socket_)
+    socket_.setsockopt_string(zmq.IDENTITY, identity)
+    socket_.connect(url)
+    return socket_
+
+
+class _JobStatusSubscriber(object):
+    """
+    Mirrors the collector's status changes into status_map on a daemon thread
+    """
+
+    def __init__(self, status_pub_url):
+        self.status_pub_url = status_pub_url
+        # Latest (time, status) per jobid. Bounded since every published jobid
+        # lands here
+        self.status_map = ut.LRUDict(JOB_STATUS_CACHE_SIZE)
+        # Notified on every published status change, see wait_for_job_result
+        self.condition = threading.Condition()
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(
+            target=self._loop, name='job-engine.status-subscriber', daemon=True
+        )
+        self.thread.start()
+
+    def _loop(self):
+        # The socket lives entirely in this thread, zmq sockets are not thread-safe
+        status_sub_socket = ctx.socket(zmq.SUB)
+        _tune_socket(status_sub_socket)
+        status_sub_socket.setsockopt(zmq.SUBSCRIBE, b'')
+        status_sub_socket.connect(self.status_pub_url)
+        try:
+            while not self.stop_event.is_set():
+                if not status_sub_socket.poll(JOB_SUBSCRIBER_POLL):
+                    continue
+                jobid, status = status_sub_socket.recv_multipart()
+                with self.condition:
+                    self.status_map[jobid.decode('utf-8')] = (
+                        time.time(),
+                        status.decode('utf-8'),
+                    )
+                    self.condition.notify_all()
+        finally:
+            status_sub_socket.close()
+
+    def stop(self):
+        self.stop_event.set()
+        self.thread.join()
+
+
+# Client sockets and status subscriber by (pid, client id, urls)
+JOB_CLIENTS = {}
+
+
+def _get_client_sockets(
+    pid, client_id, engine_pull_url, collect_pull_url, collect_status_pub_url
+):
+    """
+    Returns the engine and collector DEALER sockets and the status subscriber
+    for a client
+
+    They are created once and shared by every JobInterface with the same id and
+    ports, so re-creating an interface neither reconnects nor starts another
+    subscriber thread. The pid is part of the key because sockets must not be
+    reused across a fork. See close_client_sockets
+    """
+    key = (pid, client_id, engine_pull_url, collect_pull_url, collect_status_pub_url)
+    if key not in JOB_CLIENTS:
+        engine_socket = _make_client_socket(
+            'client{}.engine.DEALER'.format(client_id), engine_pull_url
+        )
+        collect_socket = _make_client_socket(
+            'client{}.collect.DEALER'.format(client_id), collect_pull_url
+        )
+        status_subscriber = _JobStatusSubscriber(collect_status_pub_url)
+        JOB_CLIENTS[key] = (engine_socket, collect_socket, status_subscriber)
+    return JOB_CLIENTS[key]
+
+
+def close_client_sockets():
+    """
+    Stops the status subscribers and closes the client sockets of this process
+    """
+    pid = os.getpid()
+    for key in list(JOB_CLIENTS.keys()):
+        engine_socket, collect_socket, status_subscriber = JOB_CLIENTS.pop(key)
+        # Those inherited through a fork belong to the parent
+        if key[0] == pid:
+            status_subscriber.stop()
+            engine_socket.close()
+            collect_socket.close()
+
+
 class JobInterface(object):
     def __init__(jobiface, id_, port_dict, ibs=None):
         jobiface.id_ = id_
         jobiface.ibs = ibs
         jobiface.verbose = 2 if VERBOSE_JOBS else 1
         jobiface.port_dict = port_dict
+        # Ensured once here, queue_job writes a record into it for every job
+        jobiface.shelve_path = None
+        if ibs is not None:
+            jobiface.shelve_path = ibs.get_shelves_path()
+            ut.ensuredir(jobiface.shelve_path)
+        jobiface.job_status_cache = ut.LRUDict(JOB_STATUS_CACHE_SIZE)
+        # Latest (time, status) per jobid and its condition, replaced by the shared
+        # status subscriber's in initialize_client_thread
+        jobiface.job_status_map = ut.LRUDict(JOB_STATUS_CACHE_SIZE)
+        jobiface.job_status_condition = threading.Condition()
         print('JobInterface ports:')
         ut.print_dict(jobiface.port_dict)
 
-    def __del__(jobiface):
-        if VERBOSE_JOBS:
-            print('Cleaning up job frontend')
-        if jobiface.engine_recieve_socket is not None:
-            jobiface.engine_recieve_socket.disconnect(
-                jobiface.port_dict['engine_pull_url']
-            )
-            jobiface.engine_recieve_socket.close()
-        if jobiface.collect_recieve_socket is not None:
-            jobiface.collect_recieve_socket.disconnect(
-                jobiface.port_dict['collect_pull_url']
-            )
-            jobiface.collect_recieve_socket.close()
-
     # def init(jobiface):
     #     # Starts several new processes
     #     jobiface.initialize_background_processes()
@@ -898,28 +1256,33 @@ class JobInterface(object):
         """
         if jobiface.verbose:
             print('Initializing JobInterface')
-        jobiface.engine_recieve_socket = ctx.socket(zmq.DEALER)  # CHECK2 - REQ
-        jobiface.engine_recieve_socket.setsockopt_string(
-            zmq.IDENTITY, 'client{}.engine.DEALER'.format(jobiface.id_)
+        (
+            jobiface.engine_recieve_socket,
+            jobiface.collect_recieve_socket,
+            status_subscriber,
+        ) = _get_client_sockets(
+            os.getpid(),
+            jobiface.id_,
+            jobiface.port_dict['engine_pull_url'],
+            jobiface.port_dict['collect_pull_url'],
+            jobiface.port_dict['collect_status_pub_url'],
         )
-        jobiface.engine_recieve_socket.connect(jobiface.port_dict['engine_pull_url'])
+        jobiface.job_status_map = status_subscriber.status_map
+        jobiface.job_status_condition = status_subscriber.condition
         if jobiface.verbose:
             print(
                 'connect engine_pull_url = {!r}'.format(
                     jobiface.port_dict['engine_pull_url']
                 )
             )
-
-        jobiface.collect_recieve_socket = ctx.socket(zmq.DEALER)  # CHECK2 - REQ
-        jobiface.collect_recieve_socket.setsockopt_string(
-            zmq.IDENTITY, 'client{}.collect.DEALER'.format(jobiface.id_)
-        )
-        jobiface.collect_recieve_socket.connect(jobiface.port_dict['collect_pull_url'])
-        if jobiface.verbose:
             print(
                 'connect collect_pull_url = %r'
                 % (jobiface.port_dict['collect_pull_url'],)
             )
+            print(
+                'connect collect_status_pub_url = %r'
+                % (jobiface.port_dict['collect_status_pub_url'],)
+            )
 
     def queue_interrupted_jobs(jobiface):
         import tqdm
@@ -937,6 +1300,9 @@ class JobInterface(object):
             num_records = len(record_filepath_list)
             print('Reloading %d engine jobs...' % (num_records,))
 
+            # The archive cutoff is the same for every record, compute it once
+            archive_timestamp = _archive_timestamp()
+
             shelve_input_filepath_list = []
             shelve_output_filepath_list = []
             for record_filepath in record_filepath_list:
@@ -955,13 +1321,18 @@ class JobInterface(object):
                     [shelve_path] * num_records,
                     [shelve_archive_path] * num_records,
                     [jobiface.id_] * num_records,
+                    [archive_timestamp] * num_records,
                 )
             )
             if len(arg_iter) > 0:
-                values_list = ut.util_parallel.generate2(
-                    initialize_process_record, arg_iter
-                )
-                values_list = list(values_list)
+                # Each record is independent and mostly IO, so threads overlap the waits
+                max_workers = max(1, NUM_RESTART_WORKERS)
+                with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    values_list = list(
+                        executor.map(
+                            lambda args: initialize_process_record(*args), arg_iter
+                        )
+                    )
             else:
                 values_list = []
 
@@ -1011,9 +1382,10 @@ class JobInterface(object):
                         'status': status,
                         'action': 'register',
                     }
-                    print('Sending register: {!r}'.format(reply_notify))
-                    jobiface.collect_recieve_socket.send_json(reply_notify)
-                    reply = jobiface.collect_recieve_socket.recv_json()
+                    if jobiface.verbose >= 2:
+                        print('Sending register: {!r}'.format(reply_notify))
+                    send_json(jobiface.collect_recieve_socket, reply_notify)
+                    reply = recv_json(jobiface.collect_recieve_socket)
                     jobid_ = reply['jobid']
                     assert jobid_ == jobid
                 else:
@@ -1038,26 +1410,31 @@ class JobInterface(object):
                 '__set_jobcounter__': global_jobcounter,
             }
             print('Updating completed job counter: {!r}'.format(update_notify))
-            jobiface.engine_recieve_socket.send_json(update_notify)
-            reply = jobiface.engine_recieve_socket.recv_json()
+            send_json(jobiface.engine_recieve_socket, update_notify)
+            reply = recv_json(jobiface.engine_recieve_socket)
             jobcounter_ = reply['jobcounter']
             assert jobcounter_ == global_jobcounter
 
             print('Re-sending %d engine jobs...' % (len(restart_jobcounter_list),))
 
-            index_list = np.argsort(restart_jobcounter_list)
-            zipped = list(
-                zip(restart_jobcounter_list, restart_jobid_list, restart_request_list)
+            zipped = sorted(
+                zip(restart_jobcounter_list, restart_jobid_list, restart_request_list),
+                key=itemgetter(0),
             )
-            zipped = ut.take(zipped, index_list)
 
-            for jobcounter, jobid, engine_request in tqdm.tqdm(zipped):
-                jobiface.engine_recieve_socket.send_json(engine_request)
-                reply = jobiface.engine_recieve_socket.recv_json()
-                jobcounter_ = reply['jobcounter']
-                jobid_ = reply['jobid']
-                assert jobcounter_ == jobcounter
-                assert jobid_ == jobid
+            # Pipeline the requests, the engine queue replies in the order it
+            # receives them. Windows stay well below the socket high water mark
+            with tqdm.tqdm(total=len(zipped)) as progress:
+                for chunk in ut.ichunks(zipped, JOB_RESEND_WINDOW):
+                    for jobcounter, jobid, engine_request in chunk:
+                        send_json(jobiface.engine_recieve_socket, engine_request)
+                    for jobcounter, jobid, engine_request in chunk:
+                        reply = recv_json(jobiface.engine_recieve_socket)
+                        jobcounter_ = reply['jobcounter']
+                        jobid_ = reply['jobid']
+                        assert jobcounter_ == jobcounter
+                        assert jobid_ == jobid
+                    progress.update(len(chunk))
 
     def queue_job(
         jobiface,
@@ -1085,6 +1462,8 @@ class JobInterface(object):
         have been processed by the
         """
         # NAME: job_client
+        import flask
+
         if jobiface.verbose >= 1:
             print('----')
         request = {}
@@ -1111,8 +1490,7 @@ class JobInterface(object):
                 assert jobid_ is not None and isinstance(jobid_, uuid.UUID)
             except Exception:
                 assert len(jobid) < 32, 'Job IDs cannot be more than 32 characters'
-                pattern = r'^[a-zA-Z0-9-_]+$'
-                matched = bool(re.match(pattern, jobid))
+                matched = len(jobid) > 0 and JOBID_CHARS.issuperset(jobid)
                 assert matched, 'Job IDs must be alpha-numeric'
             jobid = str(jobid_)
 
@@ -1129,32 +1507,43 @@ class JobInterface(object):
             'restart_received': None,
             'lane': lane,
         }
-        if True or jobiface.verbose >= 2:
+        if jobiface.verbose >= 2:
             print('Queue job: {}'.format(ut.repr2(engine_request, truncate=True)))
 
+        if jobid is not None:
+            # A reused jobid must not report the status of its previous run
+            jobiface._forget_job_status(jobid)
+
+        if jobid is not None and jobiface.shelve_path is not None:
+            # A reused jobid must not inherit the completion of its previous run
+            completed_filepath = get_job_completed_filepath(jobiface.shelve_path, jobid)
+            try:
+                os.remove(completed_filepath)
+            except FileNotFoundError:
+                pass
+
         # Send request to job
-        jobiface.engine_recieve_socket.send_json(engine_request)
-        reply_notify = jobiface.engine_recieve_socket.recv_json()
-        print('reply_notify = {!r}'.format(reply_notify))
+        send_json(jobiface.engine_recieve_socket, engine_request)
+        reply_notify = recv_json(jobiface.engine_recieve_socket)
+        if jobiface.verbose >= 2:
+            print('reply_notify = {!r}'.format(reply_notify))
         jobid_ = reply_notify['jobid']
+        if jobiface.verbose >= 1:
+            print('Queued jobid={!r} action={!r}'.format(jobid_, action))
 
         if jobid is not None:
             assert jobid == jobid_
         jobid = jobid_
 
-        ibs = jobiface.ibs
-        if ibs is not None:
-            shelve_path = ibs.get_shelves_path()
-            ut.ensuredir(shelve_path)
-
+        if jobiface.shelve_path is not None:
             record_filename = '{}.pkl'.format(jobid)
-            record_filepath = join(shelve_path, record_filename)
+            record_filepath = join(jobiface.shelve_path, record_filename)
             record = {
                 'request': engine_request,
                 'attempts': 0,
                 'completed': False,
             }
-            ut.save_cPkl(record_filepath, record, verbose=False)
+            save_job_record(record_filepath, record)
 
         # Release memory
         action = None
@@ -1174,28 +1563,84 @@ class JobInterface(object):
             print('Request list of job ids')
         pair_msg = dict(action='job_id_list')
         # CALLS: collector_request_status
-        jobiface.collect_recieve_socket.send_json(pair_msg)
-        reply = jobiface.collect_recieve_socket.recv_json()
+        send_json(jobiface.collect_recieve_socket, pair_msg)
+        reply = recv_json(jobiface.collect_recieve_socket)
         return reply
 
+    def _forget_job_status(jobiface, jobid):
+        with jobiface.job_status_condition:
+            if jobid in jobiface.job_status_map:
+                del jobiface.job_status_map[jobid]
+            if jobid in jobiface.job_status_cache:
+                del jobiface.job_status_cache[jobid]
+
+    def _get_cached_job_status(jobiface, jobid):
+        # Jobs that changed recently need no round-trip at all. Published statuses
+        # expire like cached replies, the PUB socket drops messages once its queue
+        # is full and a missed change must not be reported forever. Reads reorder
+        # the LRU, so they share the subscriber thread's lock
+        with jobiface.job_status_condition:
+            published = None
+            if jobid in jobiface.job_status_map:
+                published = jobiface.job_status_map[jobid]
+        if published is not None:
+            published_time, status = published
+            if time.time() - published_time < JOB_STATUS_CACHE_TTL:
+                return {'status': 'ok', 'jobid': jobid, 'jobstatus': status}
+        if jobid in jobiface.job_status_cache:
+            cached_time, cached_reply = jobiface.job_status_cache[jobid]
+            if time.time() - cached_time < JOB_STATUS_CACHE_TTL:
+                return dict(cached_reply)
+        return None
+
     def get_job_status(jobiface, jobid):
+        reply = jobiface._get_cached_job_status(jobid)
+        if reply is not None:
+            return reply
         if jobiface.verbose >= 1:
             print('----')
             print('Request status of jobid={!r}'.format(jobid))
         pair_msg = dict(action='job_status', jobid=jobid)
         # CALLS: collector_request_status
-        jobiface.collect_recieve_socket.send_json(pair_msg)
-        reply = jobiface.collect_recieve_socket.recv_json()
+        send_json(jobiface.collect_recieve_socket, pair_msg)
+        reply = recv_json(jobiface.collect_recieve_socket)
+        if reply.get('status', None) == 'ok':
+            jobiface.job_status_cache[jobid] = (time.time(), dict(reply))
         return reply
 
+    def get_job_statuses(jobiface, jobids):
+        """Returns a jobid to jobstatus dict with one collector round-trip"""
+        statuses = {}
+        missing_jobids = []
+        for jobid in jobids:
+            reply = jobiface._get_cached_job_status(jobid)
+            if reply is None:
+                missing_jobids.append(jobid)
+            else:
+                statuses[jobid] = reply['jobstatus']
+        if len(missing_jobids) > 0:
+            if jobiface.verbose >= 1:
+                print('----')
+                print('Request status of %d jobids' % (len(missing_jobids),))
+            pair_msg = dict(action='job_statuses', jobids=missing_jobids)
+            # CALLS: collector_request_status
+            send_json(jobiface.collect_recieve_socket, pair_msg)
+            reply = recv_json(jobiface.collect_recieve_socket)
+            now = time.time()
+            for jobid, status in reply['jobstatuses'].items():
+                cached_reply = {'status': 'ok', 'jobid': jobid, 'jobstatus': status}
+                jobiface.job_status_cache[jobid] = (now, cached_reply)
+                statuses[jobid] = status
+        return statuses
+
     def get_job_status_dict(jobiface):
         if False:  # jobiface.verbose >= 1:
             print('----')
             print('Request list of job ids')
         pair_msg = dict(action='job_status_dict')
         # CALLS: collector_request_status
-        jobiface.collect_recieve_socket.send_json(pair_msg)
-        reply = jobiface.collect_recieve_socket.recv_json()
+        send_json(jobiface.collect_recieve_socket, pair_msg)
+        reply = recv_json(jobiface.collect_recieve_socket)
         return reply
 
     def get_job_metadata(jobiface, jobid):
@@ -1204,8 +1649,8 @@ class JobInterface(object):
             print('Request metadata of jobid={!r}'.format(jobid))
         pair_msg = dict(action='job_input', jobid=jobid)
         # CALLS: collector_request_metadata
-        jobiface.collect_recieve_socket.send_json(pair_msg)
-        reply = jobiface.collect_recieve_socket.recv_json()
+        send_json(jobiface.collect_recieve_socket, pair_msg)
+        reply = recv_json(jobiface.collect_recieve_socket)
         return reply
 
     def get_job_result(jobiface, jobid):
@@ -1214,12 +1659,15 @@ class JobInterface(object):
             print('Request result of jobid={!r}'.format(jobid))
         pair_msg = dict(action='job_result', jobid=jobid)
         # CALLER: collector_request_result
-        jobiface.collect_recieve_socket.send_json(pair_msg)
-        reply = jobiface.collect_recieve_socket.recv_json()
+        send_json(jobiface.collect_recieve_socket, pair_msg)
+        reply = recv_json(jobiface.collect_recieve_socket)
         return reply
 
     def get_unpacked_result(jobiface, jobid):
         reply = jobiface.get_job_result(jobid)
+        return jobiface._unpack_result(reply)
+
+    def _unpack_result(jobiface, reply):
         json_result = reply['json_result']
         try:
             result = ut.from_json(json_result)
@@ -1237,11 +1685,17 @@ class JobInterface(object):
         t = ut.Timer(verbose=False)
         t.tic()
         while True:
-            reply = jobiface.get_job_status(jobid)
+            reply = jobiface._get_cached_job_status(jobid)
+            if reply is None or reply['jobstatus'] == 'exception':
+                # One round-trip returns the status, and the result if it failed
+                pair_msg = dict(action='job_wait', jobid=jobid)
+                # CALLS: collector_request_status
+                send_json(jobiface.collect_recieve_socket, pair_msg)
+                reply = recv_json(jobiface.collect_recieve_socket)
             if reply['jobstatus'] == 'completed':
                 return
             elif reply['jobstatus'] == 'exception':
-                result = jobiface.get_unpacked_result(jobid)
+                result = jobiface._unpack_result(reply)
                 # raise Exception(result)
                 print('Exception occured in engine')
                 return result
@@ -1252,7 +1706,10 @@ class JobInterface(object):
             else:
                 raise Exception('Unknown jobstatus={!r}'.format(reply['jobstatus']))
             reply = None  # Release memory
-            time.sleep(freq)
+            # Wake on the next published status change. If one was missed, the stale
+            # status expires after JOB_STATUS_CACHE_TTL and the collector is asked
+            with jobiface.job_status_condition:
+                jobiface.job_status_condition.wait(timeout=freq)
             if timeout is not None and t.toc() > timeout:
                 raise Exception('Timeout')
 
@@ -1272,6 +1729,7 @@ def collect_queue_loop(port_dict):
         print('Init make_queue_loop: name={!r}'.format(name))
     # bind the client dealer to the queue router
     recieve_socket = ctx.socket(zmq.ROUTER)  # CHECKED - ROUTER
+    _tune_socket(recieve_socket)
     recieve_socket.setsockopt_string(zmq.IDENTITY, 'queue.' + name + '.' + 'ROUTER')
     recieve_socket.bind(interface_pull)
     if VERBOSE_JOBS:
@@ -1279,6 +1737,7 @@ def collect_queue_loop(port_dict):
 
     # bind the server router to the queue dealer
     send_socket = ctx.socket(zmq.DEALER)  # CHECKED - DEALER
+    _tune_socket(send_socket)
     send_socket.setsockopt_string(zmq.IDENTITY, 'queue.' + name + '.' + 'DEALER')
     send_socket.bind(interface_push)
     if VERBOSE_JOBS:
@@ -1321,6 +1780,7 @@ def engine_queue_loop(port_dict, engine_lanes):
 
     # bind the client dealer to the queue router
     engine_receive_socket = ctx.socket(zmq.ROUTER)  # CHECK2 - REP
+    _tune_socket(engine_receive_socket)
     engine_receive_socket.setsockopt_string(
         zmq.IDENTITY, 'special_queue.' + name + '.' + 'ROUTER'
     )
@@ -1332,6 +1792,7 @@ def engine_queue_loop(port_dict, engine_lanes):
     engine_send_socket_dict = {}
     for lane in interface_engine_push_dict:
         engine_send_socket = ctx.socket(zmq.DEALER)  # CHECKED - DEALER
+        _tune_socket(engine_send_socket)
         engine_send_socket.setsockopt_string(
             zmq.IDENTITY, 'special_queue.' + lane + '.' + name + '.' + 'DEALER'
         )
@@ -1345,6 +1806,7 @@ def engine_queue_loop(port_dict, engine_lanes):
         engine_send_socket_dict[lane] = engine_send_socket
 
     collect_recieve_socket = ctx.socket(zmq.DEALER)  # CHECKED - DEALER
+    _tune_socket(collect_recieve_socket)
     collect_recieve_socket.setsockopt_string(zmq.IDENTITY, queue_name + '.collect.DEALER')
     collect_recieve_socket.connect(interface_collect_pull)
     if VERBOSE_JOBS:
@@ -1364,175 +1826,192 @@ def engine_queue_loop(port_dict, engine_lanes):
         while True:
             evts = dict(poller.poll())
             if engine_receive_socket in evts:
-                # CALLER: job_client
-                idents, engine_request = rcv_multipart_json(
-                    engine_receive_socket, num=1, print=print
-                )
-
-                set_jobcounter = engine_request.get('__set_jobcounter__', None)
-                if set_jobcounter is not None:
-                    global_jobcounter = set_jobcounter
-                    reply_notify = {
-                        'jobcounter': global_jobcounter,
-                    }
-                    print(
-                        '... notifying client that jobcounter was updated to %d'
-                        % (global_jobcounter,)
-                    )
-                    # RETURNS: job_client_return
-                    send_multipart_json(engine_receive_socket, idents, reply_notify)
-                    continue
-
-                # jobid = 'jobid-%04d' % (jobcounter,)
-                jobid = '{}'.format(uuid.uuid4())
-                jobcounter = global_jobcounter + 1
-                received = _timestamp()
-
-                action = engine_request['action']
-                args = engine_request['args']
-                kwargs = engine_request['kwargs']
-                callback_url = engine_request['callback_url']
-                callback_method = engine_request['callback_method']
-                callback_detailed = engine_request.get('callback_detailed', False)
-                request = engine_request['request']
-                restart_jobid = engine_request.get('restart_jobid', None)
-                restart_jobcounter = engine_request.get('restart_jobcounter', None)
-                restart_received = engine_request.get('restart_received', None)
-                lane = engine_request.get('lane', 'slow')
-
-                if lane not in engine_lanes:
-                    print(
-                        'WARNING: did not recognize desired lane %r from %r'
-                        % (lane, engine_lanes)
+                # Drain every request that is ready before polling again
+                while True:
+                    try:
+                        # CALLER: job_client
+                        idents, engine_request, engine_request_json = rcv_multipart_json(
+                            engine_receive_socket,
+                            num=1,
+                            print=print,
+                            flags=zmq.NOBLOCK,
+                            raw=True,
+                        )
+                    except zmq.Again:
+                        break
+
+                    set_jobcounter = engine_request.get('__set_jobcounter__', None)
+                    if set_jobcounter is not None:
+                        global_jobcounter = set_jobcounter
+                        reply_notify = {
+                            'jobcounter': global_jobcounter,
+                        }
+                        print(
+                            '... notifying client that jobcounter was updated to %d'
+                            % (global_jobcounter,)
+                        )
+                        # RETURNS: job_client_return
+                        send_multipart_json(engine_receive_socket, idents, reply_notify)
+                        continue
+
+                    # jobid = 'jobid-%04d' % (jobcounter,)
+                    jobid = '{}'.format(uuid.uuid4())
+                    jobcounter = global_jobcounter + 1
+                    received_epoch = int(time.time())
+                    received = _timestamp(received_epoch)
+
+                    action = engine_request['action']
+                    args = engine_request['args']
+                    kwargs = engine_request['kwargs']
+                    callback_url = engine_request['callback_url']
+                    callback_method = engine_request['callback_method']
+                    callback_detailed = engine_request.get('callback_detailed', False)
+                    request = engine_request['request']
+                    restart_jobid = engine_request.get('restart_jobid', None)
+                    restart_jobcounter = engine_request.get('restart_jobcounter', None)
+                    restart_received = engine_request.get('restart_received', None)
+                    restart_received_epoch = engine_request.get(
+                        'restart_received_epoch', None
                     )
-                    print('WARNING: Defaulting to slow lane')
-                    lane = 'slow'
-
-                engine_request['lane'] = lane
+                    lane = engine_request.get('lane', 'slow')
 
-                if restart_jobid is not None:
-                    '[RESTARTING] Replacing jobid={} with previous restart_jobid={}'.format(
-                        jobid,
-                        restart_jobid,
-                    )
-                    jobid = restart_jobid
+                    if lane not in engine_lanes:
+                        print(
+                            'WARNING: did not recognize desired lane %r from %r'
+                            % (lane, engine_lanes)
+                        )
+                        print('WARNING: Defaulting to slow lane')
+                        lane = 'slow'
 
-                if restart_jobcounter is not None:
-                    '[RESTARTING] Replacing jobcounter={} with previous restart_jobcounter={}'.format(
-                        jobcounter,
-                        restart_jobcounter,
-                    )
-                    jobcounter = restart_jobcounter
+                    if restart_jobid is not None:
+                        '[RESTARTING] Replacing jobid={} with previous restart_jobid={}'.format(
+                            jobid,
+                            restart_jobid,
+                        )
+                        jobid = restart_jobid
 
-                print('Creating jobid %r (counter %d)' % (jobid, jobcounter))
+                    if restart_jobcounter is not None:
+                        '[RESTARTING] Replacing jobcounter={} with previous restart_jobcounter={}'.format(
+                            jobcounter,
+                            restart_jobcounter,
+                        )
+                        jobcounter = restart_jobcounter
 
-                if restart_received is not None:
-                    received = restart_received
+                    print('Creating jobid %r (counter %d)' % (jobid, jobcounter))
 
-                ######################################################################
-                # Status: Received (Notify Collector)
-                # Reply immediately with a new jobid
-                reply_notify = {
-                    'jobid': jobid,
-                    'jobcounter': jobcounter,
-                    'status': 'received',
-                    'action': 'notification',
-                }
+                    if restart_received is not None:
+                        received = restart_received
+                        # Legacy records only have the string
+                        received_epoch = restart_received_epoch
 
-                if VERBOSE_JOBS:
-                    print('...notifying collector about new job')
-                # CALLS: collector_notify
-                collect_recieve_socket.send_json(reply_notify)
+                    ######################################################################
+                    # Status: Received (Notify Collector)
+                    # Reply immediately with a new jobid
+                    reply_notify = {
+                        'jobid': jobid,
+                        'jobcounter': jobcounter,
+                        'status': 'received',
+                        'action': 'notification',
+                    }
 
-                ######################################################################
-                # Status: Received (Notify Client)
-                if VERBOSE_JOBS:
-                    print('... notifying client that job was accepted')
-                    print('{!r}'.format(idents))
-                    print('{!r}'.format(reply_notify))
-                # RETURNS: job_client_return
-                send_multipart_json(engine_receive_socket, idents, reply_notify)
+                    # The collector is told about every step below in one message
+                    collector_events = [reply_notify]
 
-                ######################################################################
-                # Status: Metadata
+                    ######################################################################
+                    # Status: Metadata
 
-                # Reply immediately with a new jobid
-                metadata_notify = {
-                    'jobid': jobid,
-                    'metadata': {
-                        'jobcounter': jobcounter,
-                        'action': action,
-                        'args': args,
-                        'kwargs': kwargs,
-                        'callback_url': callback_url,
-                        'callback_method': callback_method,
-                        'callback_detailed': callback_detailed,
-                        'request': request,
-                        'times': {
-                            'received': received,
-                            'started': None,
-                            'updated': None,
-                            'completed': None,
-                            'runtime': None,
-                            'turnaround': None,
-                            'runtime_sec': None,
-                            'turnaround_sec': None,
+                    # Reply immediately with a new jobid
+                    metadata_notify = {
+                        'jobid': jobid,
+                        'metadata': {
+                            'jobcounter': jobcounter,
+                            'action': action,
+                            'args': args,
+                            'kwargs': kwargs,
+                            'callback_url': callback_url,
+                            'callback_method': callback_method,
+                            'callback_detailed': callback_detailed,
+                            'request': request,
+                            'times': dict(
+                                JOB_TIMES_TEMPLATE,
+                                received=received,
+                                received_epoch=received_epoch,
+                            ),
+                            'lane': lane,
                         },
-                        'lane': lane,
-                    },
-                    'action': 'metadata',
-                }
+                        'action': 'metadata',
+                    }
 
-                if VERBOSE_JOBS:
-                    print('...notifying collector about job metadata')
-                # CALLS: collector_notify
-                collect_recieve_socket.send_json(metadata_notify)
+                    collector_events.append(metadata_notify)
 
-                ######################################################################
-                # Status: Accepted (Metadata Processed)
+                    ######################################################################
+                    # Status: Accepted (Metadata Processed)
 
-                # We have been accepted, let's update the global_jobcounter
-                global_jobcounter = jobcounter
+                    # We have been accepted, let's update the global_jobcounter
+                    global_jobcounter = jobcounter
 
-                # Reply immediately with a new jobid
-                reply_notify = {
-                    'jobid': jobid,
-                    'status': 'accepted',
-                    'action': 'notification',
-                }
+                    # Reply immediately with a new jobid
+                    accepted_notify = {
+                        'jobid': jobid,
+                        'status': 'accepted',
+                        'action': 'notification',
+                    }
+                    collector_events.append(accepted_notify)
 
-                if VERBOSE_JOBS:
-                    print('...notifying collector about new job')
-                # CALLS: collector_notify
-                collect_recieve_socket.send_json(reply_notify)
+                    ######################################################################
+                    # Status: Queued
+                    # Sent ahead of the engine request so it can never land after the
+                    # engine's own 'working' notification
+                    queued_notify = {
+                        'jobid': jobid,
+                        'status': 'queued',
+                        'action': 'notification',
+                    }
+                    collector_events.append(queued_notify)
 
-                ######################################################################
-                # Status: Queueing on the Engine
-                assert 'jobid' not in engine_request
-                engine_request['jobid'] = jobid
+                    multi_notify = {
+                        'jobid': jobid,
+                        'events': collector_events,
+                        'action': 'multi_notify',
+                    }
 
-                if VERBOSE_JOBS:
-                    print('... notifying backend engine to start')
-                # CALL: engine_
-                engine_send_socket = engine_send_socket_dict[lane]
-                send_multipart_json(engine_send_socket, idents, engine_request)
+                    if VERBOSE_JOBS:
+                        print('...notifying collector about new job')
+                    # CALLS: collector_notify
+                    send_json(collect_recieve_socket, multi_notify)
+
+                    ######################################################################
+                    # Status: Received (Notify Client)
+                    if VERBOSE_JOBS:
+                        print('... notifying client that job was accepted')
+                        print('{!r}'.format(idents))
+                        print('{!r}'.format(reply_notify))
+                    # RETURNS: job_client_return
+                    send_multipart_json(engine_receive_socket, idents, reply_notify)
 
-                # Release
-                idents = None
-                engine_request = None
+                    ######################################################################
+                    # Status: Queueing on the Engine
+                    assert 'jobid' not in engine_request
+                    # The request is forwarded as the bytes the client sent, the
+                    # engine applies the jobid and resolved lane from a second part
+                    engine_update = {
+                        'jobid': jobid,
+                        'lane': lane,
+                    }
 
-                ######################################################################
-                # Status: Queued
-                queued_notify = {
-                    'jobid': jobid,
-                    'status': 'queued',
-                    'action': 'notification',
-                }
+                    if VERBOSE_JOBS:
+                        print('... notifying backend engine to start')
+                    # CALL: engine_
+                    engine_send_socket = engine_send_socket_dict[lane]
+                    engine_send_socket.send_multipart(
+                        idents + [engine_request_json, dumps_json(engine_update)],
+                        copy=False,
+                    )
 
-                if VERBOSE_JOBS:
-                    print('...notifying collector that job was queued')
-                # CALLS: collector_notify
-                collect_recieve_socket.send_json(queued_notify)
+                    # Release
+                    idents = None
+                    engine_request = None
+                    engine_request_json = None
     except KeyboardInterrupt:
         print('Caught ctrl+c in {} queue. Gracefully exiting'.format(loop_name))
 
@@ -1594,6 +2073,7 @@ def engine_loop(id_, port_dict, dbdir, containerized, lane):
     assert dbdir is not None
 
     engine_send_sock = ctx.socket(zmq.ROUTER)  # CHECKED - ROUTER
+    _tune_socket(engine_send_sock)
     engine_send_sock.setsockopt_string(
         zmq.IDENTITY,
         'engine.{}.{}'.format(lane, id_),
@@ -1601,6 +2081,7 @@ def engine_loop(id_, port_dict, dbdir, containerized, lane):
     engine_send_sock.connect(interface_engine_push)
 
     collect_recieve_socket = ctx.socket(zmq.DEALER)
+    _tune_socket(collect_recieve_socket)
     collect_recieve_socket.setsockopt_string(
         zmq.IDENTITY,
         'engine.{}.{}.collect.DEALER'.format(lane, id_),
@@ -1613,6 +2094,7 @@ def engine_loop(id_, port_dict, dbdir, containerized, lane):
 
     ibs = wbia.opendb(dbdir=dbdir, use_cache=False, web=False, daily_backup=False)
     update_proctitle('engine_loop.{}.{}'.format(lane, id_), dbname=ibs.dbname)
+    _freeze_gc()
 
     try:
         while True:
@@ -1643,19 +2125,20 @@ def engine_loop(id_, port_dict, dbdir, containerized, lane):
                     'status': 'working',
                     'action': 'notification',
                 }
-                collect_recieve_socket.send_json(reply_notify)
+                send_json(collect_recieve_socket, reply_notify)
 
                 engine_result = on_engine_request(ibs, jobid, action, args, kwargs)
                 exec_status = engine_result['exec_status']
+                # Sent as its own frame rather than escaped into the message
+                json_result = engine_result.pop('json_result').encode('utf-8')
 
                 # Notify start working
-                reply_notify = {
+                publishing_notify = {
                     # 'idents': idents,
                     'jobid': jobid,
                     'status': 'publishing',
                     'action': 'notification',
                 }
-                collect_recieve_socket.send_json(reply_notify)
 
                 # Store results in the collector
                 collect_request = {
@@ -1674,9 +2157,6 @@ def engine_loop(id_, port_dict, dbdir, containerized, lane):
                     )
                 )
 
-                # CALLS: collector_store
-                collect_recieve_socket.send_json(collect_request)
-
                 # Notify start working
                 reply_notify = {
                     # 'idents': idents,
@@ -1684,11 +2164,23 @@ def engine_loop(id_, port_dict, dbdir, containerized, lane):
                     'status': exec_status,
                     'action': 'notification',
                 }
-                collect_recieve_socket.send_json(reply_notify)
+
+                # Publishing, storing and the final status go out as one message
+                multi_notify = {
+                    'jobid': jobid,
+                    'events': [publishing_notify, collect_request, reply_notify],
+                    'action': 'multi_notify',
+                    'frames': ['json_result'],
+                }
+                # CALLS: collector_store
+                collect_recieve_socket.send_multipart(
+                    [dumps_json(multi_notify), json_result], copy=False
+                )
 
                 # We no longer need the engine result, and can clear it's memory
                 engine_request = None
                 engine_result = None
+                json_result = None
                 collect_request = None
             except KeyboardInterrupt:
                 raise
@@ -1709,19 +2201,12 @@ def engine_loop(id_, port_dict, dbdir, containerized, lane):
     # Release the IBEIS controller for each job, hopefully freeing memory
     ibs = None
 
-    # Explicitly try to release GPU memory
+    # Explicitly try to release GPU memory, only if a job brought up CUDA
+    torch = sys.modules.get('torch', None)
     try:
-        import torch
-
-        torch.cuda.empty_cache()
-    except Exception:
-        pass
-
-    # Explicitly release Python memory
-    try:
-        import gc
-
-        gc.collect()
+        if torch is not None and torch.cuda.is_initialized():
+            torch.cuda.synchronize()
+            torch.cuda.empty_cache()
     except Exception:
         pass
 
@@ -1780,7 +2265,12 @@ def on_engine_request(
                             'JOB %r FAILED (attempt %d of %d)!'
                             % (jobid, attempt, attempts)
                         )
-                        retry_delay = random.uniform(retry_delay_min, retry_delay_max)
+                        # Exponential backoff with jitter, the window doubles with
+                        # each failed attempt up to retry_delay_max
+                        retry_delay_cap = min(
+                            retry_delay_max, max(retry_delay_min, 1) * 2 ** attempt
+                        )
+                        retry_delay = random.uniform(retry_delay_min, retry_delay_cap)
                         print(
                             '\t WAITING {:0.02f} SECONDS THEN RETRYING'.format(
                                 retry_delay
@@ -1816,13 +2306,29 @@ def collector_loop(port_dict, dbdir, containerized):
 
     print = partial(ut.colorprint, color='yellow')
     collect_rout_sock = ctx.socket(zmq.ROUTER)  # CHECK2 - PULL
+    _tune_socket(collect_rout_sock)
     collect_rout_sock.setsockopt_string(zmq.IDENTITY, 'collect.ROUTER')
     collect_rout_sock.connect(port_dict['collect_push_url'])
     if VERBOSE_JOBS:
         print('connect collect_push_url  = {!r}'.format(port_dict['collect_push_url']))
 
+    status_pub_sock = ctx.socket(zmq.PUB)
+    _tune_socket(status_pub_sock)
+    status_pub_sock.bind(port_dict['collect_status_pub_url'])
+    if VERBOSE_JOBS:
+        print(
+            'bind collect_status_pub_url  = {!r}'.format(
+                port_dict['collect_status_pub_url']
+            )
+        )
+
     ibs = wbia.opendb(dbdir=dbdir, use_cache=False, web=False, daily_backup=False)
     update_proctitle('collector_loop', dbname=ibs.dbname)
+    # Collections are run by hand below instead of on allocation counts
+    _freeze_gc()
+    gc.disable()
+    num_handled = 0
+    num_frozen_jobs = 0
 
     shelve_path = ibs.get_shelves_path()
     ut.ensuredir(shelve_path)
@@ -1837,55 +2343,110 @@ def collector_loop(port_dict, dbdir, containerized):
             # CALLER: collector_request_status
             # CALLER: collector_request_metadata
             # CALLER: collector_request_result
-            idents, collect_request = rcv_multipart_json(collect_rout_sock, print=print)
-            try:
-                reply = on_collect_request(
-                    ibs,
-                    collect_request,
-                    collector_data,
-                    shelve_path,
-                    containerized=containerized,
-                )
-            except Exception as ex:
-                import traceback
-
-                print(ut.repr3(collect_request))
-                ut.printex(ex, 'ERROR in collection')
-                print(traceback.format_exc())
-                reply = {}
-
-            send_multipart_json(collect_rout_sock, idents, reply)
-
-            idents = None
-            collect_request = None
+            batch = [rcv_multipart_json(collect_rout_sock, print=print)]
+            # Drain what is already waiting (up to a bound, to keep latency low)
+            while len(batch) < JOB_COLLECT_BATCH:
+                try:
+                    batch.append(
+                        rcv_multipart_json(
+                            collect_rout_sock, print=print, flags=zmq.NOBLOCK
+                        )
+                    )
+                except zmq.Again:
+                    break
 
-            # Explicitly release Python memory
-            try:
-                import gc
+            replies = []
+            published = []
+            released = False
+            for idents, collect_request in batch:
+                try:
+                    reply = on_collect_request(
+                        ibs,
+                        collect_request,
+                        collector_data,
+                        shelve_path,
+                        containerized=containerized,
+                    )
+                except Exception as ex:
+                    print(ut.repr3(collect_request))
+                    ut.printex(ex, 'ERROR in collection')
+                    print(traceback.format_exc())
+                    reply = {}
+                replies.append((idents, reply))
+
+                action = collect_request.get('action', None)
+
+                # Publish status changes so clients do not have to poll for them
+                if action in ['notification', 'register', 'multi_notify']:
+                    jobid = reply.get('jobid', None)
+                    status = collector_data.get(jobid, {}).get('status', None)
+                    if None not in [jobid, status]:
+                        published.append([jobid.encode('utf-8'), status.encode('utf-8')])
+
+                # Storing or finishing a job releases its (possibly large) result
+                if action == 'multi_notify':
+                    events = collect_request.get('events', [])
+                    released |= any(event.get('action') == 'store' for event in events)
+                else:
+                    released |= action == 'store' or (
+                        action == 'notification'
+                        and collect_request.get('status', None) == 'completed'
+                    )
 
-                gc.collect()
-            except Exception:
-                pass
+            for idents, reply in replies:
+                send_multipart_json(collect_rout_sock, idents, reply, encode=dumps_reply)
+            for status_msg in published:
+                status_pub_sock.send_multipart(status_msg)
+
+            num_batch = len(batch)
+            batch, replies, published = None, None, None
+            idents, collect_request, reply = None, None, None
+
+            num_handled += num_batch
+            if len(collector_data) - num_frozen_jobs >= JOB_GC_FREEZE_JOBS:
+                # Job records live as long as the collector, later collections
+                # no longer need to traverse them
+                _freeze_gc()
+                num_frozen_jobs = len(collector_data)
+            elif released:
+                gc.collect(2)
+            elif num_handled % JOB_GC_INTERVAL < num_batch:
+                gc.collect(1)
     except KeyboardInterrupt:
         print('Caught ctrl+c in collector loop. Gracefully exiting')
 
+    # Let callbacks already handed off finish
+    CALLBACK_EXECUTOR.shutdown(wait=True)
+
     collect_rout_sock.disconnect(port_dict['collect_push_url'])
     collect_rout_sock.close()
+    status_pub_sock.unbind(port_dict['collect_status_pub_url'])
+    status_pub_sock.close()
 
     if VERBOSE_JOBS:
         print('Exiting collector')
 
 
-def _timestamp():
-    timezone = pytz.timezone(TIMESTAMP_TIMEZONE)
-    now = datetime.now(timezone)
+def _timestamp(epoch=None):
+    if epoch is None:
+        now = datetime.now(TIMESTAMP_TZ)
+    else:
+        now = datetime.fromtimestamp(epoch, TIMESTAMP_TZ)
     timestamp = now.strftime(TIMESTAMP_FMTSTR)
     return timestamp
 
 
+def _archive_timestamp(archive_days=JOB_ARCHIVE_DAYS):
+    now = datetime.now(TIMESTAMP_TZ)
+    now = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    archive_date = now - timedelta(days=archive_days)
+    archive_timestamp = archive_date.strftime(TIMESTAMP_FMTSTR)
+    return archive_timestamp
+
+
 def invalidate_global_cache(jobid):
-    global JOB_STATUS_CACHE
-    JOB_STATUS_CACHE.pop(jobid, None)
+    if jobid in JOB_STATUS_CACHE:
+        del JOB_STATUS_CACHE[jobid]
 
 
 def get_collector_shelve_filepaths(collector_data, jobid):
@@ -1896,7 +2457,9 @@ def get_collector_shelve_filepaths(collector_data, jobid):
     return shelve_input_filepath, shelve_output_filepath
 
 
+@lru_cache(maxsize=16384)
 def convert_to_date(timestamp):
+    # Cached: the same timestamps are parsed repeatedly when reloading jobs
     TIMESTAMP_FMTSTR_ = ' '.join(TIMESTAMP_FMTSTR.split(' ')[:-1])
     timestamp_ = ' '.join(timestamp.split(' ')[:-1])
     timestamp_date = datetime.strptime(timestamp_, TIMESTAMP_FMTSTR_)
@@ -1904,28 +2467,124 @@ def convert_to_date(timestamp):
 
 
 def calculate_timedelta(start, end):
-    start_date = convert_to_date(start)
-    end_date = convert_to_date(end)
-    delta = end_date - start_date
-
-    total_seconds = int(delta.total_seconds())
-    total_seconds_ = total_seconds
+    """Takes two epoch seconds, or two timestamp strings (e.g., legacy jobs)"""
+    if isinstance(start, str) or isinstance(end, str):
+        delta = convert_to_date(end) - convert_to_date(start)
+        total_seconds = int(delta.total_seconds())
+    else:
+        total_seconds = int(end - start)
 
-    hours = total_seconds_ // (60 * 60)
-    total_seconds_ -= hours * 60 * 60
-    minutes = total_seconds_ // 60
-    total_seconds_ -= minutes * 60
-    seconds = total_seconds_
+    hours, total_seconds_ = divmod(total_seconds, 60 * 60)
+    minutes, seconds = divmod(total_seconds_, 60)
 
     return hours, minutes, seconds, total_seconds
 
 
+def _get_times_span(times, start_key, end_key):
+    """Returns the two times to measure between, as epochs whenever both have one"""
+    start = times.get('{}_epoch'.format(start_key), None)
+    end = times.get('{}_epoch'.format(end_key), None)
+    if None in [start, end]:
+        start = times.get(start_key, None)
+        end = times.get(end_key, None)
+    return start, end
+
+
+def _send_callback(jobid, callback_url, callback_method, engine_result=None):
+    """
+    Notifies callback_url that a job finished, runs in CALLBACK_EXECUTOR so a
+    slow endpoint does not hold up the collector. The result is only sent along
+    when engine_result is given (a detailed callback)
+    """
+    try:
+        data_dict = {'jobid': jobid}
+
+        if engine_result is not None:
+            data_dict['status'] = engine_result['exec_status']
+            data_dict['json_result'] = ut.from_json(engine_result['json_result'])
+            engine_result = None  # Release memory
+
+        args = (
+            callback_url,
+            callback_method,
+            data_dict,
+        )
+        print(
+            'Attempting job completion callback to %r\n\tHTTP Method: %r\n\tData Payload: %r'
+            % args
+        )
+
+        # Perform callback
+        session = CALLBACK_LOCAL.session
+        if callback_method == 'POST':
+            if callback_url.startswith('houston+'):
+                response = call_houston(
+                    callback_url,
+                    method='POST',
+                    data=ut.to_json(data_dict),
+                    headers={'Content-Type': 'application/json'},
+                    timeout=CALLBACK_TIMEOUT,
+                )
+            else:
+                response = session.post(
+                    callback_url, data=data_dict, timeout=CALLBACK_TIMEOUT
+                )
+        elif callback_method == 'GET':
+            if callback_url.startswith('houston+'):
+                response = call_houston(
+                    callback_url,
+                    method='GET',
+                    params=data_dict,
+                    timeout=CALLBACK_TIMEOUT,
+                )
+            else:
+                response = session.get(
+                    callback_url, params=data_dict, timeout=CALLBACK_TIMEOUT
+                )
+        elif callback_method == 'PUT':
+            if callback_url.startswith('houston+'):
+                response = call_houston(
+                    callback_url,
+                    method='PUT',
+                    data=ut.to_json(data_dict),
+                    headers={'Content-Type': 'application/json'},
+                    timeout=CALLBACK_TIMEOUT,
+                )
+            else:
+                response = session.put(
+                    callback_url, data=data_dict, timeout=CALLBACK_TIMEOUT
+                )
+        else:
+            raise RuntimeError()
+
+        # Check response
+        try:
+            text = unicode(response.text).encode('utf-8')  # NOQA
+        except Exception:
+            text = None
+
+        args = (
+            response,
+            text,
+        )
+        print('Callback completed...\n\tResponse: %r\n\tText: %r' % args)
+    except Exception:
+        print('Callback FAILED!')
+
+
+def _get_collector_metadata(collector_data, jobid, shelve_input_filepath):
+    """Returns a job's metadata with the collector's in-memory times merged in"""
+    metadata = get_metadata_value(shelve_input_filepath)
+    times = collector_data.get(jobid, {}).get('times', None)
+    if None not in [metadata, times]:
+        metadata['times'] = dict(times)
+    return metadata
+
+
 def on_collect_request(
     ibs, collect_request, collector_data, shelve_path, containerized=False
 ):
     """Run whenever the collector recieves a message"""
-    import requests
-
     action = collect_request.get('action', None)
     jobid = collect_request.get('jobid', None)
     status = collect_request.get('status', None)
@@ -1935,28 +2594,34 @@ def on_collect_request(
         'jobid': jobid,
     }
 
-    # Ensure we have a collector record for the jobid
-    if jobid is not None:
+    # Ensure we have a collector record for the jobid, only new jobids are
+    # validated since a record is created once its jobid has passed
+    known = isinstance(jobid, str) and jobid in collector_data
+    if jobid is not None and not known:
         try:
             assert isinstance(jobid, str)
             try:
                 uuid.UUID(jobid)
             except Exception:
                 assert len(jobid) < 32, 'Job IDs cannot be more than 32 characters'
-                pattern = r'^[a-zA-Z0-9-_]+$'
-                matched = bool(re.match(pattern, jobid))
+                matched = len(jobid) > 0 and JOBID_CHARS.issuperset(jobid)
                 assert matched, 'Job IDs must be alpha-numeric'
         except AssertionError:
             print('Invalid Job ID')
             reply['status'] = 'error'
             return reply
 
-        if jobid not in collector_data:
-            collector_data[jobid] = {
-                'status': None,
-                'input': None,
-                'output': None,
-            }
+        collector_data[jobid] = {
+            'status': None,
+            'input': None,
+            'output': None,
+            'times': None,
+            # Where the job's values go, 'input' and 'output' are only set
+            # once they are stored
+            'filepaths': get_shelve_filepaths(ibs, jobid),
+        }
+
+    if jobid is not None:
         runtime_lock_filepath = join(shelve_path, '{}.lock'.format(jobid))
     else:
         runtime_lock_filepath = None
@@ -1964,7 +2629,8 @@ def on_collect_request(
     args = get_collector_shelve_filepaths(collector_data, jobid)
     collector_shelve_input_filepath, collector_shelve_output_filepath = args
 
-    if jobid is not None:
+    # Status polls come through here too, so the full trace is verbose only
+    if VERBOSE_JOBS and jobid is not None:
         print(
             'on_collect_request action = %r, jobid = %r, status = %r'
             % (
@@ -1995,7 +2661,8 @@ def on_collect_request(
         )
         collector_data[jobid]['status'] = status
 
-        print('Notify %s' % ut.repr3(collector_data[jobid]))
+        if VERBOSE_JOBS:
+            print('Notify %s' % ut.repr3(collector_data[jobid]))
         invalidate_global_cache(jobid)
 
         if status == 'received':
@@ -2006,33 +2673,36 @@ def on_collect_request(
                 ut.delete(runtime_lock_filepath)
 
             # Mark the engine request as finished
-            record_filename = '{}.pkl'.format(jobid)
-            record_filepath = join(shelve_path, record_filename)
-            record = ut.load_cPkl(record_filepath, verbose=False)
-            record['completed'] = True
-            ut.save_cPkl(record_filepath, record, verbose=False)
-            record = None
-
-        # Update relevant times in the shelf
-        if collector_shelve_input_filepath is None:
-            metadata = None
-        else:
-            metadata = get_shelve_value(collector_shelve_input_filepath, 'metadata')
-
-        if metadata is not None:
-            times = metadata.get('times', {})
-            times['updated'] = _timestamp()
+            completed_filepath = get_job_completed_filepath(shelve_path, jobid)
+            ut.touch(completed_filepath, verbose=False)
+
+        # Update relevant times. They are kept in memory between status changes
+        # and stored apart from the metadata once the job is final
+        times = collector_data[jobid].get('times', None)
+        if times is None and collector_shelve_input_filepath is not None:
+            times = get_shelve_value(collector_shelve_input_filepath, 'times')
+            if times is None:
+                metadata = get_shelve_value(collector_shelve_input_filepath, 'metadata')
+                if metadata is not None:
+                    times = metadata.get('times', {})
+                metadata = None  # Release memory
+            collector_data[jobid]['times'] = times
+
+        if times is not None:
+            now = int(time.time())
+            times['updated'] = _timestamp(now)
 
             if status == 'working':
-                times['started'] = _timestamp()
+                times['started'] = times['updated']
+                times['started_epoch'] = now
 
             if status == 'completed':
-                times['completed'] = _timestamp()
+                times['completed'] = times['updated']
+                times['completed_epoch'] = now
 
             # Calculate runtime
-            received = times.get('received', None)
-            started = times.get('started', None)
-            completed = times.get('completed', None)
+            started, completed = _get_times_span(times, 'started', 'completed')
+            received, completed_ = _get_times_span(times, 'received', 'completed')
             runtime = times.get('runtime', None)
             turnaround = times.get('turnaround', None)
 
@@ -2049,9 +2719,9 @@ def on_collect_request(
                 times['runtime'] = '%d hours %d min. %s sec. (total: %d sec.)' % args
                 times['runtime_sec'] = total_seconds
 
-            if None not in [received, completed] and turnaround is None:
+            if None not in [received, completed_] and turnaround is None:
                 hours, minutes, seconds, total_seconds = calculate_timedelta(
-                    received, completed
+                    received, completed_
                 )
                 args = (
                     hours,
@@ -2062,17 +2732,16 @@ def on_collect_request(
                 times['turnaround'] = '%d hours %d min. %s sec. (total: %d sec.)' % args
                 times['turnaround_sec'] = total_seconds
 
-            metadata['times'] = times
-            set_shelve_value(collector_shelve_input_filepath, 'metadata', metadata)
-
-            metadata = None  # Release memory
+            if status in JOB_STATUS_FINAL:
+                set_shelve_value(collector_shelve_input_filepath, 'times', times)
 
     elif action == 'register':
         assert None not in [jobid]
 
         invalidate_global_cache(jobid)
 
-        shelve_input_filepath, shelve_output_filepath = get_shelve_filepaths(ibs, jobid)
+        filepaths = collector_data[jobid]['filepaths']
+        shelve_input_filepath, shelve_output_filepath = filepaths
         metadata = get_shelve_value(shelve_input_filepath, 'metadata')
         engine_result = get_shelve_value(shelve_output_filepath, 'result')
 
@@ -2085,8 +2754,11 @@ def on_collect_request(
             'status': status,
             'input': shelve_input_filepath,
             'output': shelve_output_filepath,
+            'times': None,
+            'filepaths': filepaths,
         }
-        print('Register %s' % ut.repr3(collector_data[jobid]))
+        if VERBOSE_JOBS:
+            print('Register %s' % ut.repr3(collector_data[jobid]))
 
         metadata, engine_result = None, None  # Release memory
 
@@ -2096,12 +2768,18 @@ def on_collect_request(
         # From the Engine
         metadata = collect_request.get('metadata', None)
 
-        shelve_input_filepath, shelve_output_filepath = get_shelve_filepaths(ibs, jobid)
+        shelve_input_filepath, shelve_output_filepath = collector_data[jobid]['filepaths']
         collector_data[jobid]['input'] = shelve_input_filepath
 
         set_shelve_value(shelve_input_filepath, 'metadata', metadata)
+        if metadata is not None:
+            # Fresh metadata (e.g., a restarted job) resets the stored times
+            times = dict(metadata.get('times', {}))
+            collector_data[jobid]['times'] = times
+            set_shelve_value(shelve_input_filepath, 'times', times)
 
-        print('Stored Metadata %s' % ut.repr3(collector_data[jobid]))
+        if VERBOSE_JOBS:
+            print('Stored Metadata %s' % ut.repr3(collector_data[jobid]))
 
         metadata = None  # Release memory
 
@@ -2118,14 +2796,13 @@ def on_collect_request(
         jobid = engine_result.get('jobid', jobid)
         assert jobid in collector_data
 
-        shelve_input_filepath, shelve_output_filepath = get_shelve_filepaths(ibs, jobid)
+        shelve_input_filepath, shelve_output_filepath = collector_data[jobid]['filepaths']
         collector_data[jobid]['output'] = shelve_output_filepath
 
         set_shelve_value(shelve_output_filepath, 'result', engine_result)
 
-        print('Stored Result %s' % ut.repr3(collector_data[jobid]))
-
-        engine_result = None  # Release memory
+        if VERBOSE_JOBS:
+            print('Stored Result %s' % ut.repr3(collector_data[jobid]))
 
         if callback_url is not None:
             # We are using localhost as the name of the houston nginx service
@@ -2142,144 +2819,136 @@ def on_collect_request(
             message = 'callback_method {!r} unsupported'.format(callback_method)
             assert callback_method in ['POST', 'GET', 'PUT'], message
 
-            try:
-                data_dict = {'jobid': jobid}
-
-                if callback_detailed:
-                    shelve_value = get_shelve_value(shelve_output_filepath, 'result')
-                    data_dict['status'] = shelve_value['exec_status']
-                    data_dict['json_result'] = ut.from_json(shelve_value['json_result'])
-                    shelve_value = None  # Release memory
-
-                args = (
-                    callback_url,
-                    callback_method,
-                    data_dict,
-                )
-                print(
-                    'Attempting job completion callback to %r\n\tHTTP Method: %r\n\tData Payload: %r'
-                    % args
-                )
-
-                # Perform callback
-                if callback_method == 'POST':
-                    if callback_url.startswith('houston+'):
-                        response = call_houston(
-                            callback_url,
-                            method='POST',
-                            data=ut.to_json(data_dict),
-                            headers={'Content-Type': 'application/json'},
-                        )
-                    else:
-                        response = requests.post(callback_url, data=data_dict)
-                elif callback_method == 'GET':
-                    if callback_url.startswith('houston+'):
-                        response = call_houston(
-                            callback_url, method='GET', params=data_dict
-                        )
-                    else:
-                        response = requests.get(callback_url, params=data_dict)
-                elif callback_method == 'PUT':
-                    if callback_url.startswith('houston+'):
-                        response = call_houston(
-                            callback_url,
-                            method='PUT',
-                            data=ut.to_json(data_dict),
-                            headers={'Content-Type': 'application/json'},
-                        )
-                    else:
-                        response = requests.put(callback_url, data=data_dict)
-                else:
-                    raise RuntimeError()
-
-                # Check response
-                try:
-                    text = unicode(response.text).encode('utf-8')  # NOQA
-                except Exception:
-                    text = None
+            # The stored result is only sent along for a detailed callback
+            CALLBACK_EXECUTOR.submit(
+                _send_callback,
+                jobid,
+                callback_url,
+                callback_method,
+                engine_result if callback_detailed else None,
+            )
 
-                args = (
-                    response,
-                    text,
-                )
-                print('Callback completed...\n\tResponse: %r\n\tText: %r' % args)
-            except Exception:
-                print('Callback FAILED!')
+        engine_result = None  # Release memory
 
     elif action == 'job_status':
         reply['jobstatus'] = collector_data.get(jobid, {}).get('status', 'unknown')
 
-    elif action == 'job_status_dict':
-        json_result = {}
-
-        for jobid in collector_data:
+    elif action == 'job_wait':
+        status = collector_data.get(jobid, {}).get('status', 'unknown')
+        reply['jobstatus'] = status
+        if status == 'exception':
+            # Failed jobs get their result inline, waiters would ask for it next
+            engine_result = get_shelve_value(collector_shelve_output_filepath, 'result')
+            reply['json_result'] = None
+            if engine_result is not None:
+                reply['json_result'] = embed_json(engine_result['json_result'])
+            engine_result = None  # Release memory
+
+    elif action == 'job_statuses':
+        jobids = collect_request.get('jobids', [])
+        reply['jobstatuses'] = {
+            jobid_: collector_data.get(jobid_, {}).get('status', 'unknown')
+            for jobid_ in jobids
+        }
 
-            if jobid in JOB_STATUS_CACHE:
-                job_status_data = JOB_STATUS_CACHE.get(jobid, None)
-            else:
-                status = collector_data[jobid]['status']
+    elif action == 'job_status_dict':
+        jobid_set = set(JOB_STATUS_PENDING)
+        # Entries are only made for collector jobs, so any missing ones are new or
+        # were invalidated
+        if len(JOB_STATUS_CACHE) < len(collector_data):
+            jobid_set.update(
+                jobid for jobid in collector_data if jobid not in JOB_STATUS_CACHE
+            )
 
-                shelve_input_filepath, shelve_output_filepath = get_shelve_filepaths(
-                    ibs, jobid
-                )
-                metadata = get_shelve_value(shelve_input_filepath, 'metadata')
+        for jobid in jobid_set:
+            status = collector_data[jobid]['status']
 
-                cache = True
-                if metadata is None:
-                    if status in ['corrupted']:
-                        status = 'corrupted'
-                    elif status in ['suppressed']:
-                        status = 'suppressed'
-                    elif status in ['completed']:
-                        status = 'corrupted'
-                    else:
-                        # status = 'pending'
-                        cache = False
-                    metadata = {
-                        'jobcounter': -1,
-                    }
+            shelve_input_filepath = collector_data[jobid]['filepaths'][0]
+            metadata = _get_collector_metadata(
+                collector_data, jobid, shelve_input_filepath
+            )
 
-                times = metadata.get('times', {})
-                request = metadata.get('request', {})
-
-                # Support legacy jobs
-                if request is None:
-                    request = {}
-
-                job_status_data = {
-                    'status': status,
-                    'jobcounter': metadata.get('jobcounter', None),
-                    'action': metadata.get('action', None),
-                    'endpoint': request.get('endpoint', None),
-                    'function': request.get('function', None),
-                    'time_received': times.get('received', None),
-                    'time_started': times.get('started', None),
-                    'time_runtime': times.get('runtime', None),
-                    'time_updated': times.get('updated', None),
-                    'time_completed': times.get('completed', None),
-                    'time_turnaround': times.get('turnaround', None),
-                    'time_runtime_sec': times.get('runtime_sec', None),
-                    'time_turnaround_sec': times.get('turnaround_sec', None),
-                    'lane': metadata.get('lane', None),
+            cache = True
+            if metadata is None:
+                if status in ['corrupted']:
+                    status = 'corrupted'
+                elif status in ['suppressed']:
+                    status = 'suppressed'
+                elif status in ['completed']:
+                    status = 'corrupted'
+                else:
+                    # status = 'pending'
+                    cache = False
+                metadata = {
+                    'jobcounter': -1,
                 }
-                if cache:
-                    JOB_STATUS_CACHE[jobid] = job_status_data
 
-            json_result[jobid] = job_status_data
+            times = metadata.get('times', {})
+            request = metadata.get('request', {})
+
+            # Support legacy jobs
+            if request is None:
+                request = {}
+
+            job_status_data = {
+                'status': status,
+                'jobcounter': metadata.get('jobcounter', None),
+                'action': metadata.get('action', None),
+                'endpoint': request.get('endpoint', None),
+                'function': request.get('function', None),
+                'time_received': times.get('received', None),
+                'time_started': times.get('started', None),
+                'time_runtime': times.get('runtime', None),
+                'time_updated': times.get('updated', None),
+                'time_completed': times.get('completed', None),
+                'time_turnaround': times.get('turnaround', None),
+                'time_runtime_sec': times.get('runtime_sec', None),
+                'time_turnaround_sec': times.get('turnaround_sec', None),
+                'lane': metadata.get('lane', None),
+            }
+            JOB_STATUS_CACHE[jobid] = job_status_data
+            if cache:
+                JOB_STATUS_PENDING.discard(jobid)
+            else:
+                JOB_STATUS_PENDING.add(jobid)
 
-        reply['json_result'] = json_result
+        # Encoded as is, without a copy
+        reply['json_result'] = JOB_STATUS_CACHE
 
         metadata = None  # Release memory
 
+    elif action == 'multi_notify':
+        # Several requests about one job coalesced by the engine queue or an
+        # engine. Each is handled on its own so one failure does not drop the
+        # rest (e.g., the final status after a failed callback), the reply of the
+        # last one is returned. A result sent as its own frame belongs to the
+        # store event
+        json_result = collect_request.get('json_result', None)
+        for event in collect_request.get('events', []):
+            if json_result is not None and event.get('action', None) == 'store':
+                event['engine_result']['json_result'] = json_result
+            try:
+                reply = on_collect_request(
+                    ibs, event, collector_data, shelve_path, containerized=containerized
+                )
+            except Exception as ex:
+                ut.printex(ex, 'ERROR in collection of {!r}'.format(event.get('action')))
+
     elif action == 'job_id_list':
-        reply['jobid_list'] = sorted(list(collector_data.keys()))
+        # Jobs are never removed from the collector, so a change in size means
+        # new jobids
+        if len(JOB_ID_LIST) != len(collector_data):
+            JOB_ID_LIST[:] = sorted(collector_data.keys())
+        reply['jobid_list'] = JOB_ID_LIST
 
     elif action == 'job_input':
         if jobid not in collector_data:
             reply['status'] = 'invalid'
             metadata = None
         else:
-            metadata = get_shelve_value(collector_shelve_input_filepath, 'metadata')
+            metadata = _get_collector_metadata(
+                collector_data, jobid, collector_shelve_input_filepath
+            )
             if metadata is None:
                 reply['status'] = 'corrupted'
 
@@ -2312,7 +2981,7 @@ def on_collect_request(
                 reply['status'] = engine_result['exec_status']
 
                 json_result = engine_result['json_result']
-                result = ut.from_json(json_result)
+                result = embed_json(json_result)
 
         reply['json_result'] = result
 
@@ -2325,27 +2994,96 @@ def on_collect_request(
     return reply
 
 
-def send_multipart_json(sock, idents, reply):
+def dumps_json(obj):
+    """Encodes a job message as JSON bytes, using orjson when it is installed"""
+    if orjson is None:
+        return json.dumps(obj).encode('utf-8')
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+def loads_json(data):
+    """
+    Decodes a job message from JSON bytes or a buffer (e.g., a received frame),
+    using orjson when it is installed
+    """
+    if orjson is None:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def embed_json(json_text):
+    """
+    Wraps a stored job result (JSON in utool's convention) for a collector reply.
+    With orjson the text is embedded as is, otherwise it is decoded so that
+    dumps_reply encodes it again
+    """
+    if ORJSON_FRAGMENT:
+        return orjson.Fragment(json_text)
+    return ut.from_json(json_text)
+
+
+def dumps_reply(reply):
+    """Encodes a collector reply that may carry results from embed_json"""
+    if ORJSON_FRAGMENT:
+        return dumps_json(reply)
+    # Decoded results can hold UUIDs and arrays that only utool knows how to encode
+    return ut.to_json(reply)
+
+
+def send_json(sock, obj):
+    """helper"""
+    sock.send(dumps_json(obj))
+
+
+def recv_json(sock):
+    """helper"""
+    return loads_json(sock.recv())
+
+
+def send_multipart_json(sock, idents, reply, encode=dumps_json):
     """helper"""
-    reply_json = ut.to_json(reply).encode('utf-8')
+    reply_json = encode(reply)
+    if isinstance(reply_json, str):
+        reply_json = reply_json.encode('utf-8')
     reply = None
     multi_reply = idents + [reply_json]
-    sock.send_multipart(multi_reply)
+    # Large replies (e.g., job results) are handed to zmq without a copy, zmq still
+    # copies the small ones
+    sock.send_multipart(multi_reply, copy=False)
 
 
-def rcv_multipart_json(sock, num=2, print=print):
+def rcv_multipart_json(sock, num=2, print=print, flags=0, raw=False):
     """helper"""
     # note that the first two parts will be ['Controller.ROUTER', 'Client.<id_>']
     # these are needed for the reply to propagate up to the right client
-    multi_msg = sock.recv_multipart()
+    # Frames are decoded straight from zmq's buffers instead of copies of them
+    multi_msg = sock.recv_multipart(flags, copy=False)
     if VERBOSE_JOBS:
         print('----')
-        print('RCV Json: {}'.format(ut.repr2(multi_msg, truncate=True)))
-    idents = multi_msg[:num]
+        # Only the start of each frame is shown, a result frame is not copied whole
+        frame_heads = [frame.buffer[:1024].tobytes() for frame in multi_msg]
+        print('RCV Json: {}'.format(ut.repr2(frame_heads, truncate=True)))
+        frame_heads = None
+    idents = [frame.bytes for frame in multi_msg[:num]]
+    # Returned as the frame when raw, so a forwarded request is not copied either
     request_json = multi_msg[num]
-    request = ut.from_json(request_json)
-    request_json = None
+    request = loads_json(request_json.buffer)
+    trailing_frames = multi_msg[num + 1 :]
+    # Large values (e.g., a job's result JSON) named in 'frames' follow as raw
+    # parts, so they are not escaped into the request and decoded again
+    frame_names = request.pop('frames', [])
+    for name, frame in zip(frame_names, trailing_frames):
+        request[name] = frame.bytes
+    # Any other trailing parts are small JSON updates to the request, this lets a
+    # forwarded request travel as the original bytes
+    for update_frame in trailing_frames[len(frame_names) :]:
+        request.update(loads_json(update_frame.buffer))
     multi_msg = None
+    if raw:
+        return idents, request, request_json
+    request_json = None
     return idents, request
 
 